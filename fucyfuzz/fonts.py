@@ -1,4 +1,7 @@
 # fonts.py
+import functools
+
+
 class FontConfig:
     """
     Font configuration for FucyFuzz GUI with increased font sizes
@@ -31,6 +34,10 @@ class FontConfig:
     # Tab fonts
     TAB_TEXT = 16          # Increased from ~14
     
+    # Pill-shaped buttons: (base width, base height, min width, min height)
+    PILL_BUTTON = (160, 36, 140, 32)
+    PILL_BUTTON_LARGE = (200, 40, 180, 36)
+    
     # ====================
     # FONT FAMILIES
     # ====================
@@ -40,7 +47,10 @@ class FontConfig:
     # ====================
     # DIMENSION MULTIPLIERS
     # ====================
+    # Cached like the font getters below; callers round the scale factor
+    # to 2 decimals so resize bursts reuse the same few entries
     @classmethod
+    @functools.lru_cache(maxsize=64)
     def get_height(cls, widget_type, scale_factor):
         """Get height for different widget types"""
         base_heights = {
@@ -60,6 +70,7 @@ class FontConfig:
         return int(40 * scale_factor)
     
     @classmethod
+    @functools.lru_cache(maxsize=64)
     def get_width(cls, widget_type, scale_factor):
         """Get width for different widget types"""
         base_widths = {
@@ -76,12 +87,24 @@ class FontConfig:
         return int(150 * scale_factor)
     
     @classmethod
+    @functools.lru_cache(maxsize=64)
+    def get_pill_size(cls, scale_factor, large=False):
+        """Get (width, height, corner_radius) for a pill-shaped button"""
+        base_w, base_h, min_w, min_h = cls.PILL_BUTTON_LARGE if large else cls.PILL_BUTTON
+        width = max(min_w, int(base_w * scale_factor))
+        height = max(min_h, int(base_h * scale_factor))
+        # Half the height keeps the ends semi-circular
+        return width, height, height // 2
+    
+    @classmethod
+    @functools.lru_cache(maxsize=64)
     def get_padding(cls, scale_factor):
         """Get padding based on scale"""
         base_pad = 20
         return max(10, min(30, int(base_pad * scale_factor)))
     
     @classmethod
+    @functools.lru_cache(maxsize=64)
     def get_corner_radius(cls, scale_factor):
         """Get corner radius based on scale"""
         base_radius = 8
@@ -90,9 +113,12 @@ class FontConfig:
     # ====================
     # HELPER METHODS
     # ====================
+    # Font getters are cached: they return immutable tuples and are called
+    # with the same few scale factors for every widget built or rescaled
     
     
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def get_demo_button_font(scale_factor=1.0, bold=True):
             """Get consistent font for demo buttons"""
             base_size = 14
@@ -103,24 +129,28 @@ class FontConfig:
             return ("Arial", size)
     
     @classmethod
+    @functools.lru_cache(maxsize=32)
     def get_title_font(cls, scale_factor=1.0):
         """Get title font with scaling"""
         size = max(20, min(36, int(cls.MAIN_TITLE * scale_factor)))
         return (cls.SANS_SERIF, size, "bold")
     
     @classmethod
+    @functools.lru_cache(maxsize=32)
     def get_section_font(cls, scale_factor=1.0):
         """Get section title font with scaling"""
         size = max(18, min(30, int(cls.SECTION_TITLE * scale_factor)))
         return (cls.SANS_SERIF, size, "bold")
     
     @classmethod
+    @functools.lru_cache(maxsize=32)
     def get_tab_font(cls, scale_factor=1.0):
         """Get tab font with scaling"""
         size = max(14, min(24, int(cls.TAB_TEXT * scale_factor)))
         return (cls.SANS_SERIF, size, "bold")
     
     @classmethod
+    @functools.lru_cache(maxsize=32)
     def get_label_font(cls, scale_factor=1.0, bold=False):
         """Get label font with scaling"""
         size = max(13, min(22, int(cls.LABEL * scale_factor)))
@@ -129,6 +159,7 @@ class FontConfig:
         return (cls.SANS_SERIF, size)
     
     @classmethod
+    @functools.lru_cache(maxsize=32)
     def get_button_font(cls, scale_factor=1.0, bold=False, large=False):
         """Get button font with scaling"""
         base_size = cls.BUTTON_LARGE if large else cls.BUTTON
@@ -138,30 +169,35 @@ class FontConfig:
         return (cls.SANS_SERIF, size)
     
     @classmethod
+    @functools.lru_cache(maxsize=32)
     def get_entry_font(cls, scale_factor=1.0):
         """Get entry/dropdown font with scaling"""
         size = max(12, min(20, int(cls.ENTRY * scale_factor)))
         return (cls.SANS_SERIF, size)
     
     @classmethod
+    @functools.lru_cache(maxsize=32)
     def get_checkbox_font(cls, scale_factor=1.0):
         """Get checkbox font with scaling"""
         size = max(11, min(18, int(cls.CHECKBOX * scale_factor)))
         return (cls.SANS_SERIF, size)
     
     @classmethod
+    @functools.lru_cache(maxsize=32)
     def get_console_font(cls, scale_factor=1.0):
         """Get console text font with scaling"""
         size = max(12, min(18, int(cls.CONSOLE_TEXT * scale_factor)))
         return (cls.MONOSPACE, size)
     
     @classmethod
+    @functools.lru_cache(maxsize=32)
     def get_console_header_font(cls, scale_factor=1.0):
         """Get console header font with scaling"""
         size = max(13, min(20, int(cls.CONSOLE_HEADER * scale_factor)))
         return (cls.SANS_SERIF, size, "bold")
     
     @classmethod
+    @functools.lru_cache(maxsize=32)
     def get_mono_font(cls, scale_factor=1.0, size_multiplier=1.0):
         """Get monospaced font for code/text display"""
         base_size = cls.CONSOLE_MONO * size_multiplier
@@ -2,7 +2,14 @@
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
 import subprocess
+import codecs
+import csv
+import functools
+import io
+import json
 import os
+import queue
+import re
 import sys
 import time
 import random
@@ -12,6 +19,145 @@ import threading
 from fonts import FontConfig
 from ui_scaling import UIScaling
 
+# Colors shared by every CTkOptionMenu in the frames
+_DROPDOWN_STYLE = dict(fg_color="#1f538d", button_color="#1f538d", button_hover_color="#14375e")
+
+
+# ==============================================================================
+#  UDS DECODING HELPERS
+# ==============================================================================
+
+# dump_dids data line: the DID token, then the data record as one hex run,
+# e.g. "0xf190 4655435954454348"; header ranges and progress lines don't match
+_DID_LINE_RE = re.compile(r'^\s*0x(f[0-9a-f]{3})\s+((?:[0-9a-f]{2}\s*)+)$', re.IGNORECASE)
+# Data bytes after the DLC of a candump line, e.g. "[8]  10 14 62 F1 90 46 55 43"
+_CANDUMP_RE = re.compile(r'\]\s*((?:[0-9a-f]{2}\b\s*)+)$', re.IGNORECASE)
+# Characters accepted in a bare hex byte word
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+# Preformatted "\xNN" strings for every byte value
+_BACKSLASH_HEX = tuple(f"\\x{b:02X}" for b in range(256))
+
+# Byte -> display char for payloads: printable ASCII as is, NUL as "·" (0xB7
+# in latin-1), anything else as "."; use with bytes.translate
+_ASCII_DOTTED = bytes(b if 32 <= b <= 126 else (0xB7 if b == 0 else 0x2E) for b in range(256))
+# Same, but other non-printable bytes are spelled out as \xNN
+_ASCII_ESCAPED = tuple(chr(b) if 32 <= b <= 126 else ("·" if b == 0 else _BACKSLASH_HEX[b])
+                       for b in range(256))
+# 1 for bytes that show up as text in the dotted view; "." does not count,
+# since it cannot be told apart from a placeholder
+_PRINTABLE_SIEVE = bytes(1 if 32 <= b <= 126 and b != 0x2E else 0 for b in range(256))
+
+
+def _escaped_ascii(data):
+    """ASCII view of a payload with non-printable bytes spelled out as \\xNN"""
+    text = data.translate(_ASCII_DOTTED).decode("latin-1")
+    # Only a "." can stand for a byte that needs escaping; payloads without
+    # one read the same in both views, so skip the per-byte pass
+    if "." not in text:
+        return text
+    return "".join([_ASCII_ESCAPED[byte] for byte in data])
+
+
+# UDS negative response codes
+_NRC_CODES = {
+    0x11: "Service not supported",
+    0x12: "Sub-function not supported",
+    0x13: "Incorrect message length or format",
+    0x22: "Conditions not correct",
+    0x31: "Request out of range",
+    0x33: "Security access denied",
+    0x35: "Invalid key",
+    0x78: "Response pending"
+}
+
+# Static reference block closing every dump_dids decode report
+_UDS_FORMAT_REFERENCE = "".join([
+    "\n" + "=" * 70 + "\n",
+    "📚 UDS RESPONSE FORMAT REFERENCE:\n\n",
+    "✅ Positive Response (0x62) format:\n",
+    "   Byte 0: 0x10 (First Frame)\n",
+    "   Byte 1: Total data length (n)\n",
+    "   Byte 2: 0x62 (Positive response to service 0x22)\n",
+    "   Byte 3-4: DID (2 bytes, e.g., F1 90)\n",
+    "   Byte 5+: Data payload\n\n",
+    "❌ Negative Response (0x7F) format:\n",
+    "   Byte 0: 0x10 (First Frame)\n",
+    "   Byte 1: 0x03 (Length)\n",
+    "   Byte 2: 0x7F (Negative response)\n",
+    "   Byte 3: Requested service (e.g., 0x22)\n",
+    "   Byte 4: NRC (Negative Response Code)\n\n",
+    "🔧 Common NRC Codes:\n",
+    *(f"   0x{code:02X} - {desc}\n" for code, desc in _NRC_CODES.items()),
+    "=" * 70 + "\n",
+])
+
+# UDS response service IDs, short names for the analyzer
+_SERVICE_NAMES = {
+    0x62: "Read Data By Identifier (0x22)",
+    0x7F: "Negative Response",
+    0x67: "Security Access (0x27)",
+    0x6E: "Tester Present (0x3E)"
+}
+
+# Same service IDs, described as responses for the dump_dids decoder
+_RESPONSE_NAMES = {
+    0x62: "Positive Response to Read Data By Identifier (0x22)",
+    0x7F: "Negative Response",
+    0x67: "Positive Response to Security Access (0x27)",
+    0x6E: "Positive Response to Tester Present (0x3E)"
+}
+
+# Well-known manufacturer DIDs
+_DID_NAMES = {
+    0xF190: "VIN (Vehicle Identification Number)",
+    0xF180: "Boot Software ID",
+    0xF181: "Application Software ID",
+    0xF186: "Active Session",
+    0xF187: "Spare Part Number",
+    0xF188: "ECU SW Number",
+    0xF198: "Repair Shop Code",
+    0xF18C: "ECU Serial Number"
+}
+
+# Single DIDs offered by the DID reader dropdown: (hex digits, short name)
+_DID_OPTIONS = (
+    ("F190", "VIN (Vehicle ID)"),
+    ("F180", "Boot Software ID"),
+    ("F181", "Application Software ID"),
+    ("F186", "Active Session"),
+    ("F187", "Spare Part Number"),
+    ("F188", "ECU SW Number"),
+    ("F198", "Repair Shop Code"),
+    ("F18C", "ECU Serial Number"),
+)
+# Dropdown label -> DID hex digits, e.g. "Single DID: 0xF190 - VIN (Vehicle ID)" -> "F190"
+_DID_LABEL_TO_HEX = {f"Single DID: 0x{did} - {name}": did for did, name in _DID_OPTIONS}
+_DID_CUSTOM = "Custom DID"
+_DID_SCAN_RANGE = "Scan Range: 0xF180-0xF1FF (Manufacturer DIDs)"
+_DID_LABELS = (*_DID_LABEL_TO_HEX, _DID_CUSTOM, _DID_SCAN_RANGE)
+# candump captures loaded by the UDS Analyzer's example buttons
+_UDS_EXAMPLES = {
+    "vin": """vcan0  7E8   [8]  10 14 62 F1 90 46 55 43
+vcan0  7E8   [8]  21 59 54 45 43 48 2D 56
+vcan0  7E8   [8]  22 49 4E 2D 30 30 30 31""",
+
+    "boot": """vcan0  7E8   [8]  10 0E 62 F1 80 46 55 43
+vcan0  7E8   [8]  21 59 2D 42 4F 4F 54 2D
+vcan0  7E8   [8]  22 56 31 2E 30 00 00 00""",
+
+    "app": """vcan0  7E8   [8]  10 10 62 F1 81 46 55 43
+vcan0  7E8   [8]  21 59 2D 41 50 50 2D 56
+vcan0  7E8   [8]  22 32 2E 35 2E 31 00 00""",
+
+    "serial": """vcan0  7E8   [8]  10 12 62 F1 8C 53 4E 2D
+vcan0  7E8   [8]  21 46 55 43 59 2D 38 38
+vcan0  7E8   [8]  22 38 38 38 38 38 38 38"""
+}
+
+# Custom DID entry: 4 hex digits with an optional 0x prefix
+_CUSTOM_DID_RE = re.compile(r'(?:0x)?([0-9a-f]{4})', re.IGNORECASE)
+
 
 # ==============================================================================
 #  BASE FRAME WITH SCALING AND TRANSITIONS
@@ -25,13 +171,15 @@ class ScalableFrame(ctk.CTkFrame):
         self.base_width = 1400
         self.base_height = 800
         self._current_scale = 1.0
-        self._transition_in_progress = False
-        self._last_scale_update = 0
-        self._widget_registry = []  # Track widgets for scaling
+        self._scale_pending = None   # Latest scale factor waiting to be applied
+        self._scale_after_id = None  # Pending _flush_scale callback, if any
+        self._widgets_by_kind = {}  # Track widgets for scaling, grouped by type
+        self._applied = {}  # Last frame-specific scaling values, by name
+        self._optional_shown = frozenset()  # Names of optional widgets currently gridded
         
     def register_widget(self, widget, widget_type="button"):
         """Register a widget for automatic scaling"""
-        self._widget_registry.append((widget, widget_type))
+        self._widgets_by_kind.setdefault(widget_type, []).append(widget)
     
     def update_scaling(self):
         """Update scaling based on current frame size"""
@@ -39,43 +187,97 @@ class ScalableFrame(ctk.CTkFrame):
         current_height = self.winfo_height()
 
         if current_width > 100 and current_height > 100:
-            scale_factor = min(current_width / self.base_width, current_height / self.base_height)
+            # Snapped to 0.05 steps so the FontConfig/UIScaling caches see a
+            # handful of keys and equal sizes compare equal
+            scale_factor = round(min(current_width / self.base_width, current_height / self.base_height) * 20) / 20
             self._apply_scaling_with_transition(scale_factor)
 
     def _apply_scaling_with_transition(self, scale_factor):
-        """Apply scaling with smooth transition effect"""
-        current_time = time.time()
-        if (self._transition_in_progress or
-            abs(scale_factor - self._current_scale) < 0.05 or
-            current_time - self._last_scale_update < 0.05):
+        """Debounce scaling: resize bursts within 50 ms are applied once, at the latest size"""
+        # Spurious geometry events at the applied scale need no timer at all
+        if self._scale_after_id is None and scale_factor == self._current_scale:
+            return
+        self._scale_pending = scale_factor
+        if self._scale_after_id is None:
+            self._scale_after_id = self.after(50, self._flush_scale)
+
+    def _flush_scale(self):
+        """Apply the latest pending scale factor if it differs from the applied one"""
+        self._scale_after_id = None
+        scale_factor = self._scale_pending
+        if not self.winfo_exists() or scale_factor == self._current_scale:
             return
 
-        self._transition_in_progress = True
-        self._last_scale_update = current_time
         self._current_scale = scale_factor
 
         # Apply scaling to all registered widgets
         self._apply_scaling(scale_factor)
 
-        # Reset transition flag after a short delay for smooth effect
-        self.after(50, lambda: setattr(self, '_transition_in_progress', False))
-
     def _apply_scaling(self, scale_factor):
         """Apply scaling to all registered widgets - to be overridden by subclasses"""
         # Scale registered widgets
-        for widget, widget_type in self._widget_registry:
-            if widget.winfo_exists():
-                UIScaling.scale_widget(widget, widget_type, scale_factor)
+        for widget_type, widgets in self._widgets_by_kind.items():
+            for widget in widgets:
+                if widget.winfo_exists():
+                    UIScaling.scale_widget(widget, widget_type, scale_factor)
         
         # Also scale all children recursively
         UIScaling.scale_frame_children(self, scale_factor, exclude_types=["CTkTabview"])
 
+    def _build_header(self, title, help_modules, report_name, failures=True, padx=5):
+        """Create the title row with the Help, Report and (optionally) View Failures buttons"""
+        app = self.app
+        self.head_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.head_frame.pack(fill="x")
+
+        self.title_label = ctk.CTkLabel(self.head_frame, text=title, font=FontConfig.get_title_font(1.0))
+        self.title_label.pack(side="left")
+        self.register_widget(self.title_label, "title")
+
+        self.help_btn = ctk.CTkButton(self.head_frame, text="❓", fg_color="#f39c12", text_color="white",
+                      command=functools.partial(app.show_module_help, help_modules))
+        self.help_btn.pack(side="right", padx=padx)
+        self.register_widget(self.help_btn, "button_small")
+
+        self.report_btn = ctk.CTkButton(self.head_frame, text="📥 Report (PDF)",
+                      command=functools.partial(app.save_module_report, report_name))
+        self.report_btn.pack(side="right", padx=padx)
+        self.register_widget(self.report_btn, "button_small")
+
+        if failures:
+            self.view_failures_btn = ctk.CTkButton(self.head_frame, text="📊 View Failures",
+                          fg_color="#e74c3c", command=app.show_failure_cases)
+            self.view_failures_btn.pack(side="right", padx=padx)
+            self.register_widget(self.view_failures_btn, "button_small")
+
+    def _show_optional(self, wanted):
+        """grid() the named optional widgets in wanted and grid_remove() the other shown ones"""
+        # grid_remove keeps each widget's row and options, so only the
+        # widgets whose visibility changes are touched
+        for name in self._optional_shown - wanted:
+            getattr(self, name).grid_remove()
+        for name in wanted - self._optional_shown:
+            getattr(self, name).grid()
+        self._optional_shown = wanted
+
+    def _scaling_changed(self, name, value):
+        """Record a frame-specific scaling value; False if it equals the last one applied"""
+        # Clamped sizes repeat across scales, so subclasses skip configure
+        # passes whose inputs did not change
+        if self._applied.get(name) == value:
+            return False
+        self._applied[name] = value
+        return True
+
 
 # ==============================================================================
 #  FRAME CLASSES
 # ==============================================================================
 
 class ConfigFrame(ScalableFrame):
+    # Static labels of the options grid: (text, row, column)
+    GRID_LABELS = (("Fucyfuzz Path:", 0, 0), ("Interface:", 1, 0), ("Channel:", 2, 0))
+
     def __init__(self, parent, app):
         super().__init__(parent, app)
 
@@ -87,11 +289,12 @@ class ConfigFrame(ScalableFrame):
         self.grid_frame = ctk.CTkFrame(self)
         self.grid_frame.pack(fill="x", pady=20)
 
-        # Working Directory Section
-        wd_label = ctk.CTkLabel(self.grid_frame, text="Fucyfuzz Path:")
-        wd_label.grid(row=0, column=0, padx=20, pady=20)
-        self.register_widget(wd_label, "label")
+        for text, row, column in self.GRID_LABELS:
+            lbl = ctk.CTkLabel(self.grid_frame, text=text)
+            lbl.grid(row=row, column=column, padx=20, pady=20)
+            self.register_widget(lbl, "label")
 
+        # Working Directory Section
         self.wd_entry = ctk.CTkEntry(self.grid_frame, placeholder_text="/path/to/fucyfuzz")
         self.wd_entry.grid(row=0, column=1, padx=(20, 5), pady=20, sticky="ew")
         self.wd_entry.insert(0, app.working_dir)
@@ -102,19 +305,11 @@ class ConfigFrame(ScalableFrame):
         self.register_widget(self.browse_btn, "button")
 
         # Interface Section
-        interface_label = ctk.CTkLabel(self.grid_frame, text="Interface:")
-        interface_label.grid(row=1, column=0, padx=20, pady=20)
-        self.register_widget(interface_label, "label")
-
         self.driver = ctk.CTkOptionMenu(self.grid_frame, values=["socketcan", "vector", "pcan"],
-                                        fg_color="#1f538d", button_color="#1f538d", button_hover_color="#14375e")
+                                        **_DROPDOWN_STYLE)
         self.driver.grid(row=1, column=1, padx=20, pady=20, sticky="ew")
         self.register_widget(self.driver, "dropdown")
 
-        channel_label = ctk.CTkLabel(self.grid_frame, text="Channel:")
-        channel_label.grid(row=2, column=0, padx=20, pady=20)
-        self.register_widget(channel_label, "label")
-
         self.channel = ctk.CTkEntry(self.grid_frame, placeholder_text="vcan0")
         self.channel.grid(row=2, column=1, padx=20, pady=20, sticky="ew")
         self.register_widget(self.channel, "entry")
@@ -131,6 +326,8 @@ class ConfigFrame(ScalableFrame):
         
         # Additional frame-specific scaling
         padding = FontConfig.get_padding(scale_factor)
+        if not self._scaling_changed("padding", padding):
+            return
         self.grid_frame.configure(padx=padding, pady=padding)
         
         # Update grid row/column padding
@@ -146,17 +343,38 @@ class ConfigFrame(ScalableFrame):
             self.wd_entry.insert(0, dir_path)
 
     def save(self):
-        # Update App Working Directory
+        # Checking the path can block for seconds on a stale network mount,
+        # so do it off the Tk thread and finish saving once it is known
         new_wd = self.wd_entry.get().strip()
-        if os.path.exists(new_wd):
+
+        def check_wd():
+            exists = os.path.isdir(new_wd)
+            self.after(0, self._finish_save, new_wd, exists)
+
+        threading.Thread(target=check_wd, daemon=True).start()
+
+    def _finish_save(self, new_wd, exists):
+        # Update App Working Directory
+        if exists:
             self.app.working_dir = new_wd
             self.app._console_write(f"[CONFIG] Working Directory updated to: {new_wd}\n")
         else:
             messagebox.showwarning("Warning", "Path does not exist. Working directory not updated.")
 
         try:
-            with open(os.path.expanduser("~/.canrc"), "w") as f:
-                f.write(f"[default]\ninterface={self.driver.get()}\nchannel={self.channel.get()}\n")
+            path = os.path.expanduser("~/.canrc")
+            payload = f"[default]\ninterface={self.driver.get()}\nchannel={self.channel.get()}\n".encode()
+
+            # Write a temp file in one call and swap it in, so a crash
+            # never leaves python-can a half-written config
+            tmp = path + ".tmp"
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, payload)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp, path)
             self.app._console_write("[CONFIG] ~/.canrc Config Saved.\n")
         except Exception as e: 
             messagebox.showerror("Error", str(e))
@@ -166,23 +384,7 @@ class ReconFrame(ScalableFrame):
     def __init__(self, parent, app):
         super().__init__(parent, app)
 
-        self.head_frame = ctk.CTkFrame(self, fg_color="transparent")
-        self.head_frame.pack(fill="x")
-
-        self.title_label = ctk.CTkLabel(self.head_frame, text="Reconnaissance", font=FontConfig.get_title_font(1.0))
-        self.title_label.pack(side="left")
-        self.register_widget(self.title_label, "title")
-
-        # Buttons
-        self.help_btn = ctk.CTkButton(self.head_frame, text="❓", fg_color="#f39c12", text_color="white",
-                      command=lambda: app.show_module_help("listener"))
-        self.help_btn.pack(side="right", padx=10)
-        self.register_widget(self.help_btn, "button_small")
-
-        self.report_btn = ctk.CTkButton(self.head_frame, text="📥 Report (PDF)",
-                      command=lambda: app.save_module_report("Recon"))
-        self.report_btn.pack(side="right", padx=10)
-        self.register_widget(self.report_btn, "button_small")
+        self._build_header("Reconnaissance", "listener", "Recon", failures=False, padx=10)
 
         # Center the main button with better padding
         self.button_container = ctk.CTkFrame(self, fg_color="transparent")
@@ -192,7 +394,7 @@ class ReconFrame(ScalableFrame):
         self.interface_frame = ctk.CTkFrame(self.button_container, fg_color="transparent")
         self.interface_frame.pack(pady=(0, 20))
 
-        self.use_interface = ctk.BooleanVar(value=True)
+        self.use_interface = app.use_interface_var  # Shared with the other tabs
         self.interface_check = ctk.CTkCheckBox(self.interface_frame, text="Use -i vcan0 interface",
                                              variable=self.use_interface)
         self.interface_check.pack()
@@ -525,15 +727,11 @@ class ReconFrame(ScalableFrame):
         """Apply responsive scaling to all elements"""
         super()._apply_scaling(scale_factor)
         
-        # Scale master demo button
+        # Scale master demo button and progress label; always re-applied,
+        # since the generic pass above may have just reset them
         if hasattr(self, 'master_demo_btn'):
             font = FontConfig.get_button_font(scale_factor)
-            width = max(180, int(200 * scale_factor))
-            height = max(36, int(40 * scale_factor))
-            
-            # Maintain semi-circle rounding
-            corner_radius = height // 2
-            
+            width, height, corner_radius = FontConfig.get_pill_size(scale_factor, large=True)
             self.master_demo_btn.configure(
                 font=font,
                 width=width,
@@ -541,44 +739,28 @@ class ReconFrame(ScalableFrame):
                 corner_radius=corner_radius
             )
         
-        # Scale progress label
         if hasattr(self, 'progress_label'):
-            font = FontConfig.get_label_font(scale_factor * 0.9)
-            self.progress_label.configure(font=font)
+            self.progress_label.configure(font=FontConfig.get_label_font(scale_factor * 0.9))
 
 class DemoFrame(ScalableFrame):
+    # fucyfuzz arguments for the demo fuzzers and their reset-to-0 messages
+    SPEED_FUZZ_CMD = ("fuzzer", "mutate", "244", "..", "-d", "0.5")
+    SPEED_RESET_CMD = ("send", "message", "0x244#00")
+    INDICATOR_FUZZ_CMD = ("fuzzer", "mutate", "188", ".", "-d", "0.5")
+    INDICATOR_RESET_CMD = ("send", "message", "0x188#00")
+    DOOR_FUZZ_CMD = ("fuzzer", "mutate", "19B", "........", "-d", "0.5")
+    DOOR_RESET_CMD = ("send", "message", "0x19B#00.00.00.00")
+
+    # Bits of _active_mask, one per running demo fuzzer
+    SPEED_FUZZ = 1
+    INDICATOR_FUZZ = 2
+    DOOR_FUZZ = 4
+
     def __init__(self, parent, app):
         super().__init__(parent, app)
 
         # ================= HEADER =================
-        self.head_frame = ctk.CTkFrame(self, fg_color="transparent")
-        self.head_frame.pack(fill="x")
-
-        self.title_label = ctk.CTkLabel(
-            self.head_frame,
-            text="Demo commands",
-            font=FontConfig.get_title_font(1.0)
-        )
-        self.title_label.pack(side="left")
-        self.register_widget(self.title_label, "title")
-
-        self.help_btn = ctk.CTkButton(
-            self.head_frame,
-            text="❓",
-            fg_color="#f39c12",
-            text_color="white",
-            command=lambda: app.show_module_help(["demo", "fuzzer", "send"])
-        )
-        self.help_btn.pack(side="right", padx=5)
-        self.register_widget(self.help_btn, "button_small")
-
-        self.report_btn = ctk.CTkButton(
-            self.head_frame,
-            text="📥 Report (PDF)",
-            command=lambda: app.save_module_report("Demo")
-        )
-        self.report_btn.pack(side="right", padx=5)
-        self.register_widget(self.report_btn, "button_small")
+        self._build_header("Demo commands", ["demo", "fuzzer", "send"], "Demo", failures=False)
 
         # ================= MAIN CONTAINER =================
         self.button_container = ctk.CTkFrame(self, fg_color="transparent")
@@ -642,31 +824,27 @@ class DemoFrame(ScalableFrame):
         self.register_widget(self.door_btn, "button")
 
         # ================= STATE =================
-        self.fuzzing_speed_active = False
-        self.fuzzing_indicator_active = False
-        self.fuzzing_door_active = False
+        self._active_mask = 0  # SPEED_FUZZ | INDICATOR_FUZZ | DOOR_FUZZ bits
 
         self.speed_process = None
         self.indicator_process = None
         self.door_process = None
 
+        # Long-lived "fucyfuzz --server" process for one-shot commands
+        self._worker = None
+        self._worker_wd = None
+
     # ======================================================
     # PROCESS RUNNER
     # ======================================================
     def run_demo_command(self, cmd_args, description):
         try:
-            working_dir = self.app.working_dir
-            env = os.environ.copy()
-            env["PYTHONPATH"] = working_dir + os.pathsep + env.get("PYTHONPATH", "")
-
-            cmd = [sys.executable, "-m", "fucyfuzz.fucyfuzz"] + cmd_args
-
             proc = subprocess.Popen(
-                cmd,
+                [*self.app._cached_cmd_prefix, *cmd_args],
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
-                cwd=working_dir,
-                env=env
+                cwd=self.app.working_dir,
+                env=self.app._subprocess_env()
             )
 
             self.app._console_write(f"[DEMO] {description}\n")
@@ -676,22 +854,83 @@ class DemoFrame(ScalableFrame):
             self.app._console_write(f"[DEMO ERROR] {e}\n")
             return None
 
+    def _watch_demo_process(self, proc, attr, stop):
+        """Reset a fuzz toggle when its process exits on its own"""
+        def wait():
+            code = proc.wait()
+            self.after(0, finish, code)
+
+        def finish(code):
+            # Still the current process means Stop was never pressed
+            if getattr(self, attr) is proc:
+                self.app._console_write(f"[DEMO] Fuzz process exited (code {code})\n")
+                stop(reset=False)
+
+        # Blocks in wait() instead of polling; the exit is handed to the Tk thread
+        threading.Thread(target=wait, daemon=True).start()
+
+    def _demo_worker(self):
+        """The shared fucyfuzz --server process, (re)started when it is gone or the working dir changed"""
+        working_dir = self.app.working_dir
+        if self._worker is None or self._worker.poll() is not None or self._worker_wd != working_dir:
+            if self._worker and self._worker.poll() is None:
+                self._worker.stdin.close()
+
+            # Exits by itself once its stdin is closed, e.g. when the app quits
+            self._worker = subprocess.Popen(
+                self.app._cached_cmd_prefix + ["--server"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                cwd=working_dir,
+                env=self.app._subprocess_env(),
+                text=True
+            )
+            self._worker_wd = working_dir
+        return self._worker
+
+    def send_demo_command(self, cmd_args, description):
+        """Run a short command in the shared worker process instead of a new interpreter"""
+        line = json.dumps(cmd_args) + "\n"
+        try:
+            try:
+                worker = self._demo_worker()
+                worker.stdin.write(line)
+                worker.stdin.flush()
+            except BrokenPipeError:
+                # The worker died after the poll() check; drop it and send
+                # the command again on a fresh one
+                try:
+                    self._worker.stdin.close()
+                except BrokenPipeError:
+                    pass
+                self._worker = None
+                worker = self._demo_worker()
+                worker.stdin.write(line)
+                worker.stdin.flush()
+            self.app._console_write(f"[DEMO] {description}\n")
+
+        except Exception as e:
+            self.app._console_write(f"[DEMO ERROR] {e}\n")
+
     # ======================================================
     # SPEED FUZZ TOGGLE
     # ======================================================
     def toggle_speed_fuzz(self):
-        if not self.fuzzing_speed_active:
+        if not self._active_mask & self.SPEED_FUZZ:
             # Start speed fuzzing
-            self.fuzzing_speed_active = True
+            self._active_mask |= self.SPEED_FUZZ
             self.speed_btn.configure(
                 text="⏹ Stop Speed Fuzz (Reset to 0)",
                 fg_color="#c0392b"
             )
             
             self.speed_process = self.run_demo_command(
-                ["fuzzer", "mutate", "244", "..", "-d", "0.5"],
+                self.SPEED_FUZZ_CMD,
                 "Speed fuzz started"
             )
+            if self.speed_process:
+                self._watch_demo_process(self.speed_process, "speed_process", self._stop_speed_fuzz)
         else:
             # Stop speed fuzzing and reset to 0
             self._stop_speed_fuzz(reset=True)
@@ -702,7 +941,7 @@ class DemoFrame(ScalableFrame):
             self.speed_process.terminate()
             self.speed_process = None
 
-        self.fuzzing_speed_active = False
+        self._active_mask &= ~self.SPEED_FUZZ
         self.speed_btn.configure(
             text="▶ Start Speed Fuzz",
             fg_color="#1f538d"
@@ -711,8 +950,8 @@ class DemoFrame(ScalableFrame):
         if reset:
             self.app._console_write("[DEMO] Speed fuzz stopped and reset to 0\n")
             # Reset speed to 0
-            self.run_demo_command(
-                ["send", "message", "0x244#00"],
+            self.send_demo_command(
+                self.SPEED_RESET_CMD,
                 "Speed reset to 0"
             )
         else:
@@ -722,18 +961,20 @@ class DemoFrame(ScalableFrame):
     # INDICATOR FUZZ TOGGLE
     # ======================================================
     def toggle_indicator_fuzz(self):
-        if not self.fuzzing_indicator_active:
+        if not self._active_mask & self.INDICATOR_FUZZ:
             # Start indicator fuzzing
-            self.fuzzing_indicator_active = True
+            self._active_mask |= self.INDICATOR_FUZZ
             self.indicator_btn.configure(
                 text="⏹ Stop Indicator Fuzz (Reset OFF)",
                 fg_color="#c0392b"
             )
             
             self.indicator_process = self.run_demo_command(
-                ["fuzzer", "mutate", "188", ".", "-d", "0.5"],
+                self.INDICATOR_FUZZ_CMD,
                 "Indicator fuzz started"
             )
+            if self.indicator_process:
+                self._watch_demo_process(self.indicator_process, "indicator_process", self._stop_indicator_fuzz)
         else:
             # Stop indicator fuzzing and reset OFF
             self._stop_indicator_fuzz(reset=True)
@@ -744,7 +985,7 @@ class DemoFrame(ScalableFrame):
             self.indicator_process.terminate()
             self.indicator_process = None
 
-        self.fuzzing_indicator_active = False
+        self._active_mask &= ~self.INDICATOR_FUZZ
         self.indicator_btn.configure(
             text="▶ Start Indicator Fuzz",
             fg_color="#1f538d"
@@ -753,8 +994,8 @@ class DemoFrame(ScalableFrame):
         if reset:
             self.app._console_write("[DEMO] Indicator fuzz stopped and reset OFF\n")
             # Reset indicators OFF
-            self.run_demo_command(
-                ["send", "message", "0x188#00"],
+            self.send_demo_command(
+                self.INDICATOR_RESET_CMD,
                 "Indicators reset OFF"
             )
         else:
@@ -764,18 +1005,20 @@ class DemoFrame(ScalableFrame):
     # DOOR FUZZ TOGGLE
     # ======================================================
     def toggle_door_fuzz(self):
-        if not self.fuzzing_door_active:
+        if not self._active_mask & self.DOOR_FUZZ:
             # Start door fuzzing
-            self.fuzzing_door_active = True
+            self._active_mask |= self.DOOR_FUZZ
             self.door_btn.configure(
                 text="⏹ Stop Door Fuzz (Reset Closed)",
                 fg_color="#c0392b"
             )
             
             self.door_process = self.run_demo_command(
-                ["fuzzer", "mutate", "19B", "........", "-d", "0.5"],
+                self.DOOR_FUZZ_CMD,
                 "Door fuzz started"
             )
+            if self.door_process:
+                self._watch_demo_process(self.door_process, "door_process", self._stop_door_fuzz)
         else:
             # Stop door fuzzing and reset closed
             self._stop_door_fuzz(reset=True)
@@ -786,7 +1029,7 @@ class DemoFrame(ScalableFrame):
             self.door_process.terminate()
             self.door_process = None
 
-        self.fuzzing_door_active = False
+        self._active_mask &= ~self.DOOR_FUZZ
         self.door_btn.configure(
             text="▶ Start Door Fuzz",
             fg_color="#1f538d"
@@ -795,25 +1038,34 @@ class DemoFrame(ScalableFrame):
         if reset:
             self.app._console_write("[DEMO] Door fuzz stopped and reset closed\n")
             # Reset doors to closed
-            self.run_demo_command(
-                ["send", "message", "0x19B#00.00.00.00"],
+            self.send_demo_command(
+                self.DOOR_RESET_CMD,
                 "Doors reset closed"
             )
         else:
             self.app._console_write("[DEMO] Door fuzz stopped\n")
 
+    def stop_all(self, reset=True):
+        """Stop every running demo fuzzer"""
+        if not self._active_mask:
+            return
+        if self._active_mask & self.SPEED_FUZZ:
+            self._stop_speed_fuzz(reset)
+        if self._active_mask & self.INDICATOR_FUZZ:
+            self._stop_indicator_fuzz(reset)
+        if self._active_mask & self.DOOR_FUZZ:
+            self._stop_door_fuzz(reset)
+
     # ======================================================
     # SCALING
     # ======================================================
     def _apply_scaling(self, scale_factor):
         super()._apply_scaling(scale_factor)
 
+        # Always re-applied: the generic pass above has just resized these
+        # as plain buttons, even when the clamped pill size is unchanged
         font = FontConfig.get_button_font(scale_factor)
-        width = max(140, int(160 * scale_factor))
-        height = max(32, int(36 * scale_factor))
-        
-        # Calculate corner radius as half of the current height for semi-circle effect
-        corner_radius = height // 2
+        width, height, corner_radius = FontConfig.get_pill_size(scale_factor)
 
         buttons = [
             self.speed_btn,
@@ -831,45 +1083,7 @@ class FuzzerFrame(ScalableFrame):
         super().__init__(parent, app)
 
         # Header
-        self.head_frame = ctk.CTkFrame(self, fg_color="transparent")
-        self.head_frame.pack(fill="x")
-
-        self.title_label = ctk.CTkLabel(
-            self.head_frame,
-            text="Signal Fuzzer",
-            font=FontConfig.get_title_font(1.0)
-        )
-        self.title_label.pack(side="left")
-        self.register_widget(self.title_label, "title")
-
-        # Buttons
-        self.help_btn = ctk.CTkButton(
-            self.head_frame,
-            text="❓",
-            fg_color="#f39c12",
-            text_color="white",
-            command=lambda: app.show_module_help("fuzzer")
-        )
-        self.help_btn.pack(side="right", padx=10)
-        self.register_widget(self.help_btn, "button_small")
-
-        self.report_btn = ctk.CTkButton(
-            self.head_frame,
-            text="📥 Report (PDF)",
-            command=lambda: app.save_module_report("Fuzzer")
-        )
-        self.report_btn.pack(side="right", padx=10)
-        self.register_widget(self.report_btn, "button_small")
-
-        # NEW: View Failures button
-        self.view_failures_btn = ctk.CTkButton(
-            self.head_frame,
-            text="📊 View Failures",
-            fg_color="#e74c3c",
-            command=lambda: app.show_failure_cases()
-        )
-        self.view_failures_btn.pack(side="right", padx=10)
-        self.register_widget(self.view_failures_btn, "button_small")
+        self._build_header("Signal Fuzzer", "fuzzer", "Fuzzer", padx=10)
 
         # Tabs
         self.tabs = ctk.CTkTabview(self)
@@ -888,9 +1102,7 @@ class FuzzerFrame(ScalableFrame):
             self.smart_tab,
             values=["No DBC Loaded"],
             command=self.on_msg_select,
-            fg_color="#1f538d",
-            button_color="#1f538d",
-            button_hover_color="#14375e"
+            **_DROPDOWN_STYLE
         )
         self.msg_select.pack(pady=10, fill="x", padx=20)
         self.register_widget(self.msg_select, "dropdown")
@@ -915,9 +1127,7 @@ class FuzzerFrame(ScalableFrame):
         self.mode = ctk.CTkOptionMenu(
             self.smart_tab,
             values=["brute", "mutate"],
-            fg_color="#1f538d",
-            button_color="#1f538d",
-            button_hover_color="#14375e"
+            **_DROPDOWN_STYLE
         )
         self.mode.pack(pady=20, fill="x", padx=20)
         self.register_widget(self.mode, "dropdown")
@@ -926,7 +1136,7 @@ class FuzzerFrame(ScalableFrame):
         self.interface_frame = ctk.CTkFrame(self.smart_tab, fg_color="transparent")
         self.interface_frame.pack(pady=10, fill="x", padx=20)
 
-        self.use_interface = ctk.BooleanVar(value=True)
+        self.use_interface = app.use_interface_var  # Shared with the other tabs
         self.interface_check = ctk.CTkCheckBox(
             self.interface_frame,
             text="Use -i vcan0 interface",
@@ -948,7 +1158,22 @@ class FuzzerFrame(ScalableFrame):
         #
         # ───────────────────────────────────────────── Random Fuzz ─────────────────────────────────────────────
         #
+        # Only one tab shows at a time; the Random widgets are built when it is first opened
         self.rnd_tab = self.tabs.add("Random")
+        self._random_built = False
+        self.tabs.configure(command=self._on_tab_change)
+
+    #
+    # ───────────────────────────────────────────── Random Tab ─────────────────────────────────────────────
+    #
+
+    def _on_tab_change(self):
+        if self.tabs.get() == "Random" and not self._random_built:
+            self._build_random_tab()
+
+    def _build_random_tab(self):
+        """Create the Random Fuzz widgets on first visit"""
+        self._random_built = True
 
         # Interface checkbox (RANDOM)
         self.random_interface_frame = ctk.CTkFrame(self.rnd_tab, fg_color="transparent")
@@ -980,6 +1205,10 @@ class FuzzerFrame(ScalableFrame):
         self.random_btn.pack(pady=10, fill="x", padx=20)
         self.register_widget(self.random_btn, "button_large")
 
+        UIScaling.scale_frame_children(self.rnd_tab, self._current_scale)
+        if "padding" in self._applied:
+            self._pad_tab(self.rnd_tab, self._applied["padding"])
+
     #
     # ───────────────────────────────────────────── Fuzzing Logic ─────────────────────────────────────────────
     #
@@ -1029,19 +1258,23 @@ class FuzzerFrame(ScalableFrame):
     def _apply_scaling(self, scale_factor):
         super()._apply_scaling(scale_factor)
 
-        if hasattr(self.tabs, '_segmented_button'):
-            self.tabs._segmented_button.configure(
-                font=FontConfig.get_tab_font(scale_factor)
-            )
+        tab_font = FontConfig.get_tab_font(scale_factor)
+        if hasattr(self.tabs, '_segmented_button') and self._scaling_changed("tab_font", tab_font):
+            self.tabs._segmented_button.configure(font=tab_font)
 
         tab_padding = FontConfig.get_padding(scale_factor)
+        if not self._scaling_changed("padding", tab_padding):
+            return
         self.tabs.pack_configure(pady=tab_padding)
 
         for tab_name in ["Targeted", "Random"]:
-            tab = self.tabs.tab(tab_name)
-            for child in tab.winfo_children():
-                if isinstance(child, (ctk.CTkFrame, ctk.CTkScrollableFrame)):
-                    child.pack_configure(padx=tab_padding, pady=tab_padding)
+            self._pad_tab(self.tabs.tab(tab_name), tab_padding)
+
+    def _pad_tab(self, tab, padding):
+        """Apply the scaled padding to the frames packed in a tab"""
+        for child in tab.winfo_children():
+            if isinstance(child, (ctk.CTkFrame, ctk.CTkScrollableFrame)):
+                child.pack_configure(padx=padding, pady=padding)
 
     #
     # ───────────────────────────────────────────── Helpers ─────────────────────────────────────────────
@@ -1059,66 +1292,40 @@ class FuzzerFrame(ScalableFrame):
 
 
 class LengthAttackFrame(ScalableFrame):
+    # Static labels of the attack card: (text, row, column)
+    CARD_LABELS = (("DBC Message (Optional):", 0, 0), ("OR Enter Target ID (Hex):", 1, 0), ("Extra Args:", 2, 0))
+
     def __init__(self, parent, app):
         super().__init__(parent, app)
 
-        self.head_frame = ctk.CTkFrame(self, fg_color="transparent")
-        self.head_frame.pack(fill="x")
-
-        self.title_label = ctk.CTkLabel(self.head_frame, text="Length Attack", font=FontConfig.get_title_font(1.0))
-        self.title_label.pack(side="left")
-        self.register_widget(self.title_label, "title")
-
-        # Buttons
-        self.help_btn = ctk.CTkButton(self.head_frame, text="❓", fg_color="#f39c12", text_color="white",
-                      command=lambda: app.show_module_help("lenattack"))
-        self.help_btn.pack(side="right", padx=10)
-        self.register_widget(self.help_btn, "button_small")
-
-        self.report_btn = ctk.CTkButton(self.head_frame, text="📥 Report (PDF)",
-                      command=lambda: app.save_module_report("LengthAttack"))
-        self.report_btn.pack(side="right", padx=10)
-        self.register_widget(self.report_btn, "button_small")
-
-        # NEW: View Failures button
-        self.view_failures_btn = ctk.CTkButton(self.head_frame, text="📊 View Failures", 
-                      fg_color="#e74c3c", command=lambda: app.show_failure_cases())
-        self.view_failures_btn.pack(side="right", padx=10)
-        self.register_widget(self.view_failures_btn, "button_small")
+        self._build_header("Length Attack", "lenattack", "LengthAttack", padx=10)
 
         self.card = ctk.CTkFrame(self, corner_radius=12)
         self.card.pack(fill="x", padx=30, pady=30)
 
-        # Row 0: DBC Select (Optional)
-        dbc_label = ctk.CTkLabel(self.card, text="DBC Message (Optional):")
-        dbc_label.grid(row=0, column=0, padx=20, pady=15)
-        self.register_widget(dbc_label, "label")
+        for text, row, column in self.CARD_LABELS:
+            lbl = ctk.CTkLabel(self.card, text=text)
+            lbl.grid(row=row, column=column, padx=20, pady=15)
+            self.register_widget(lbl, "label")
 
+        # Row 0: DBC Select (Optional)
         self.msg_select = ctk.CTkOptionMenu(self.card, values=["No DBC Loaded"], command=self.on_msg_select,
-                                            fg_color="#1f538d", button_color="#1f538d", button_hover_color="#14375e")
+                                            **_DROPDOWN_STYLE)
         self.msg_select.grid(row=0, column=1, padx=20, pady=15, sticky="ew")
         self.register_widget(self.msg_select, "dropdown")
 
         # Row 1: Target ID (Manual entry - always available)
-        target_label = ctk.CTkLabel(self.card, text="OR Enter Target ID (Hex):")
-        target_label.grid(row=1, column=0, padx=20, pady=15)
-        self.register_widget(target_label, "label")
-
         self.lid = ctk.CTkEntry(self.card, placeholder_text="0x123")
         self.lid.grid(row=1, column=1, padx=20, pady=15, sticky="ew")
         self.register_widget(self.lid, "entry")
 
         # Row 2: Extra Args
-        args_label = ctk.CTkLabel(self.card, text="Extra Args:")
-        args_label.grid(row=2, column=0, padx=20, pady=15)
-        self.register_widget(args_label, "label")
-
         self.largs = ctk.CTkEntry(self.card, placeholder_text="Optional (e.g. -v)")
         self.largs.grid(row=2, column=1, padx=20, pady=15, sticky="ew")
         self.register_widget(self.largs, "entry")
 
         # Row 3: Interface checkbox
-        self.use_interface = ctk.BooleanVar(value=True)
+        self.use_interface = app.use_interface_var  # Shared with the other tabs
         self.interface_check = ctk.CTkCheckBox(self.card, text="Use -i vcan0 interface",
                                              variable=self.use_interface)
         self.interface_check.grid(row=3, column=0, columnspan=2, padx=20, pady=15, sticky="w")
@@ -1136,6 +1343,8 @@ class LengthAttackFrame(ScalableFrame):
         
         # Update card padding
         card_padding = FontConfig.get_padding(scale_factor)
+        if not self._scaling_changed("padding", card_padding):
+            return
         self.card.pack_configure(padx=card_padding * 1.5, pady=card_padding * 1.5)
         
         # Update grid cell padding
@@ -1173,32 +1382,39 @@ class LengthAttackFrame(ScalableFrame):
 
 
 class DCMFrame(ScalableFrame):
+    # Optional widgets visible for each action (target ID is always shown)
+    ACTION_WIDGETS = {
+        "discovery": frozenset({"blacklist_label", "dcm_blacklist", "autoblacklist_frame"}),
+        "services": frozenset({"dcm_rid_label", "dcm_rid"}),
+        "subfunc": frozenset({"dcm_rid_label", "dcm_rid", "subfunc_frame"}),
+        "dtc": frozenset({"dcm_rid_label", "dcm_rid"}),
+        "testerpresent": frozenset(),
+    }
+    # Positional arguments per action, in command order:
+    # (entry attribute, error shown when it is empty, or None if optional)
+    ACTION_ARGS = {
+        "discovery": (("dcm_tid", None),),  # discovery can work without target ID
+        "services": (("dcm_tid", "Target ID is required for this action"),
+                     ("dcm_rid", "Response ID is required for this action")),
+        "subfunc": (("dcm_tid", "Target ID is required for this action"),
+                    ("dcm_rid", "Response ID is required for this action"),
+                    ("dcm_service", "Service parameter is required for subfunc"),
+                    ("dcm_subfunc", None),
+                    ("dcm_data", None)),
+        "dtc": (("dcm_tid", "Target ID is required for this action"),
+                ("dcm_rid", "Response ID is required for this action")),
+        "testerpresent": (("dcm_tid", "Target ID is required for this action"),),
+    }
+    # Optional flags per action: (entry attribute, flag, value may hold several words)
+    ACTION_OPTIONS = {
+        "discovery": (("dcm_blacklist", "-blacklist", True),
+                      ("dcm_autoblacklist", "-autoblacklist", False)),
+    }
+
     def __init__(self, parent, app):
         super().__init__(parent, app)
 
-        self.head_frame = ctk.CTkFrame(self, fg_color="transparent")
-        self.head_frame.pack(fill="x")
-
-        self.title_label = ctk.CTkLabel(self.head_frame, text="DCM Diagnostics", font=FontConfig.get_title_font(1.0))
-        self.title_label.pack(side="left")
-        self.register_widget(self.title_label, "title")
-
-        # Buttons
-        self.help_btn = ctk.CTkButton(self.head_frame, text="❓", fg_color="#f39c12", text_color="white",
-                      command=lambda: app.show_module_help("dcm"))
-        self.help_btn.pack(side="right", padx=5)
-        self.register_widget(self.help_btn, "button_small")
-
-        self.report_btn = ctk.CTkButton(self.head_frame, text="📥 Report (PDF)",
-                      command=lambda: app.save_module_report("DCM"))
-        self.report_btn.pack(side="right", padx=5)
-        self.register_widget(self.report_btn, "button_small")
-
-        # NEW: View Failures button
-        self.view_failures_btn = ctk.CTkButton(self.head_frame, text="📊 View Failures", 
-                      fg_color="#e74c3c", command=lambda: app.show_failure_cases())
-        self.view_failures_btn.pack(side="right", padx=5)
-        self.register_widget(self.view_failures_btn, "button_small")
+        self._build_header("DCM Diagnostics", "dcm", "DCM")
 
         # DCM Action Selection
         action_label = ctk.CTkLabel(self, text="DCM Action:")
@@ -1207,7 +1423,7 @@ class DCMFrame(ScalableFrame):
 
         self.dcm_act = ctk.CTkOptionMenu(self,
                                        values=["discovery", "services", "subfunc", "dtc", "testerpresent"],
-                                       fg_color="#1f538d", button_color="#1f538d", button_hover_color="#14375e",
+                                       **_DROPDOWN_STYLE,
                                        command=self.on_dcm_action_change)
         self.dcm_act.pack(pady=10, fill="x", padx=20)
         self.dcm_act.set("discovery")
@@ -1219,7 +1435,7 @@ class DCMFrame(ScalableFrame):
         self.register_widget(dbc_label, "label")
 
         self.msg_select = ctk.CTkOptionMenu(self, values=["No DBC Loaded"], command=self.on_msg_select,
-                                            fg_color="#1f538d", button_color="#1f538d", button_hover_color="#14375e")
+                                            **_DROPDOWN_STYLE)
         self.msg_select.pack(pady=5, fill="x", padx=20)
         self.register_widget(self.msg_select, "dropdown")
 
@@ -1229,30 +1445,32 @@ class DCMFrame(ScalableFrame):
 
         # Target ID (for most DCM commands)
         target_label = ctk.CTkLabel(self.dcm_params_frame, text="Target ID:")
-        target_label.pack(anchor="w")
+        target_label.grid(row=0, column=0, sticky="w")
         self.register_widget(target_label, "label")
 
         self.dcm_tid = ctk.CTkEntry(self.dcm_params_frame, placeholder_text="e.g., 0x733")
-        self.dcm_tid.pack(fill="x", pady=5)
+        self.dcm_tid.grid(row=1, column=0, sticky="ew", pady=5)
         self.register_widget(self.dcm_tid, "entry")
 
         # Response ID (for services, subfunc, dtc)
         self.dcm_rid_label = ctk.CTkLabel(self.dcm_params_frame, text="Response ID:")
-        self.dcm_rid_label.pack(anchor="w")
+        self.dcm_rid_label.grid(row=2, column=0, sticky="w")
         self.register_widget(self.dcm_rid_label, "label")
 
         self.dcm_rid = ctk.CTkEntry(self.dcm_params_frame, placeholder_text="e.g., 0x633")
-        self.dcm_rid.pack(fill="x", pady=5)
+        self.dcm_rid.grid(row=3, column=0, sticky="ew", pady=5)
         self.register_widget(self.dcm_rid, "entry")
 
         # Additional parameters for subfunc
         self.subfunc_frame = ctk.CTkFrame(self.dcm_params_frame, fg_color="transparent")
+        self.subfunc_frame.grid(row=4, column=0, sticky="ew", pady=8)
 
         self.subfunc_label = ctk.CTkLabel(self.subfunc_frame, text="Subfunction Parameters:")
-        self.subfunc_label.pack(anchor="w")
+        self.subfunc_label.pack(anchor="w", pady=(10, 0))
         self.register_widget(self.subfunc_label, "label")
 
         self.subfunc_params_frame = ctk.CTkFrame(self.subfunc_frame, fg_color="transparent")
+        self.subfunc_params_frame.pack(fill="x", pady=5)
 
         service_label = ctk.CTkLabel(self.subfunc_params_frame, text="Service:")
         service_label.grid(row=0, column=0, padx=(0, 5))
@@ -1279,6 +1497,7 @@ class DCMFrame(ScalableFrame):
         self.register_widget(self.dcm_data, "entry")
 
         self.subfunc_params_frame.grid_columnconfigure(6, weight=1)
+        self.dcm_params_frame.grid_columnconfigure(0, weight=1)
 
         # DCM Options Frame
         self.dcm_options_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -1286,15 +1505,16 @@ class DCMFrame(ScalableFrame):
 
         # Blacklist options
         self.blacklist_label = ctk.CTkLabel(self.dcm_options_frame, text="Blacklist IDs (space separated):")
-        self.blacklist_label.pack(anchor="w")
+        self.blacklist_label.grid(row=0, column=0, sticky="w")
         self.register_widget(self.blacklist_label, "label")
 
         self.dcm_blacklist = ctk.CTkEntry(self.dcm_options_frame, placeholder_text="0x123 0x456")
-        self.dcm_blacklist.pack(fill="x", pady=5)
+        self.dcm_blacklist.grid(row=1, column=0, sticky="ew", pady=5)
         self.register_widget(self.dcm_blacklist, "entry")
 
         # Auto blacklist
         self.autoblacklist_frame = ctk.CTkFrame(self.dcm_options_frame, fg_color="transparent")
+        self.autoblacklist_frame.grid(row=2, column=0, sticky="ew", pady=5)
 
         self.autoblacklist_label = ctk.CTkLabel(self.autoblacklist_frame, text="Auto Blacklist Count:")
         self.autoblacklist_label.pack(side="left")
@@ -1303,6 +1523,7 @@ class DCMFrame(ScalableFrame):
         self.dcm_autoblacklist = ctk.CTkEntry(self.autoblacklist_frame, placeholder_text="10", width=80)
         self.dcm_autoblacklist.pack(side="left", padx=10)
         self.register_widget(self.dcm_autoblacklist, "entry")
+        self.dcm_options_frame.grid_columnconfigure(0, weight=1)
 
         # Extra Args
         extra_label = ctk.CTkLabel(self, text="Extra Args:")
@@ -1325,102 +1546,34 @@ class DCMFrame(ScalableFrame):
         self.dcm_execute_btn.pack(pady=20, fill="x", padx=20)
         self.register_widget(self.dcm_execute_btn, "button_large")
 
-        # Initialize UI based on default action
+        # Every optional widget starts gridded; the default action hides the rest
+        self._optional_shown = frozenset().union(*self.ACTION_WIDGETS.values())
         self.on_dcm_action_change("discovery")
 
     def on_dcm_action_change(self, selection):
         """Update DCM UI based on selected action"""
-        # Hide all optional elements first
-        self.dcm_rid_label.pack_forget()
-        self.dcm_rid.pack_forget()
-        self.subfunc_label.pack_forget()
-        self.subfunc_frame.pack_forget()
-        self.subfunc_params_frame.pack_forget()
-        self.blacklist_label.pack_forget()
-        self.dcm_blacklist.pack_forget()
-        self.autoblacklist_label.pack_forget()
-        self.autoblacklist_frame.pack_forget()
-        self.dcm_autoblacklist.pack_forget()
-
-        # Show common elements
-        self.dcm_tid.pack(fill="x", pady=5)
-
-        # Action-specific configurations
-        if selection == "discovery":
-            # Show blacklist options for discovery
-            self.blacklist_label.pack(anchor="w")
-            self.dcm_blacklist.pack(fill="x", pady=5)
-
-            self.autoblacklist_label.pack(side="left")
-            self.dcm_autoblacklist.pack(side="left", padx=10)
-            self.autoblacklist_frame.pack(fill="x", pady=5)
-
-        elif selection in ["services", "dtc"]:
-            # Show response ID for services and dtc
-            self.dcm_rid_label.pack(anchor="w")
-            self.dcm_rid.pack(fill="x", pady=5)
-
-        elif selection == "subfunc":
-            # Show response ID and subfunction parameters
-            self.dcm_rid_label.pack(anchor="w")
-            self.dcm_rid.pack(fill="x", pady=5)
-
-            self.subfunc_label.pack(anchor="w", pady=(10, 0))
-            self.subfunc_params_frame.pack(fill="x", pady=5)
-            self.subfunc_frame.pack(fill="x", pady=8)
-
-        elif selection == "testerpresent":
-            # Only target ID needed for testerpresent
-            pass
+        self._show_optional(self.ACTION_WIDGETS.get(selection, frozenset()))
 
     def run_dcm(self):
         """Execute DCM command"""
         action = self.dcm_act.get()
-        cmd = ["dcm", action]
 
-        # Add target ID if provided
-        tid = self.dcm_tid.get().strip()
-        if tid:
-            cmd.append(tid)
-        elif action != "discovery":  # discovery can work without target ID
-            messagebox.showerror("Error", "Target ID is required for this action")
-            return
-
-        # Action-specific parameters
-        if action in ["services", "subfunc", "dtc"]:
-            rid = self.dcm_rid.get().strip()
-            if rid:
-                cmd.append(rid)
-            else:
-                messagebox.showerror("Error", "Response ID is required for this action")
+        # Read the action's positional entries once, then validate in order
+        values = [(getattr(self, attr).get().strip(), error)
+                  for attr, error in self.ACTION_ARGS.get(action, ())]
+        for value, error in values:
+            if not value and error:
+                messagebox.showerror("Error", error)
                 return
 
-        if action == "subfunc":
-            # Add subfunction parameters
-            service = self.dcm_service.get().strip()
-            subfunc = self.dcm_subfunc.get().strip()
-            data = self.dcm_data.get().strip()
+        cmd = ["dcm", action, *(value for value, _ in values if value)]
 
-            if service:
-                cmd.append(service)
-            else:
-                messagebox.showerror("Error", "Service parameter is required for subfunc")
-                return
-
-            if subfunc:
-                cmd.append(subfunc)
-            if data:
-                cmd.append(data)
-
-        # Add blacklist options for discovery
-        if action == "discovery":
-            blacklist = self.dcm_blacklist.get().strip()
-            if blacklist:
-                cmd.extend(["-blacklist"] + blacklist.split())
-
-            autoblacklist = self.dcm_autoblacklist.get().strip()
-            if autoblacklist:
-                cmd.extend(["-autoblacklist", autoblacklist])
+        # Add the action's optional flags (blacklist options for discovery)
+        for attr, flag, multiple in self.ACTION_OPTIONS.get(action, ()):
+            value = getattr(self, attr).get().strip()
+            if value:
+                cmd.append(flag)
+                cmd.extend(value.split() if multiple else (value,))
 
         # Add extra arguments if provided
         extra_args = self.dcm_extra_args.get().strip()
@@ -1449,32 +1602,23 @@ class DCMFrame(ScalableFrame):
 
 
 class UDSFrame(ScalableFrame):
+    # Optional widgets visible for each action (target ID is always shown)
+    ACTION_WIDGETS = {
+        "discovery": frozenset({"blacklist_label", "uds_blacklist", "autoblacklist_frame"}),
+        "services": frozenset({"uds_rid_label", "uds_rid"}),
+        "subservices": frozenset({"uds_rid_label", "uds_rid"}),
+        "ecu_reset": frozenset({"uds_rid_label", "uds_rid", "ecu_reset_frame"}),
+        "testerpresent": frozenset(),
+        "security_seed": frozenset({"uds_rid_label", "uds_rid", "security_seed_frame"}),
+        "dump_dids": frozenset({"uds_rid_label", "uds_rid", "did_range_frame"}),
+        "read_mem": frozenset({"uds_rid_label", "uds_rid", "memory_frame"}),
+        "read_did": frozenset({"uds_rid_label", "uds_rid", "did_frame"}),
+    }
+
     def __init__(self, parent, app):
         super().__init__(parent, app)
 
-        self.head_frame = ctk.CTkFrame(self, fg_color="transparent")
-        self.head_frame.pack(fill="x")
-
-        self.title_label = ctk.CTkLabel(self.head_frame, text="UDS Diagnostics", font=FontConfig.get_title_font(1.0))
-        self.title_label.pack(side="left")
-        self.register_widget(self.title_label, "title")
-
-        # Buttons
-        self.help_btn = ctk.CTkButton(self.head_frame, text="❓", fg_color="#f39c12", text_color="white",
-                      command=lambda: app.show_module_help("uds"))
-        self.help_btn.pack(side="right", padx=5)
-        self.register_widget(self.help_btn, "button_small")
-
-        self.report_btn = ctk.CTkButton(self.head_frame, text="📥 Report (PDF)",
-                      command=lambda: app.save_module_report("UDS"))
-        self.report_btn.pack(side="right", padx=5)
-        self.register_widget(self.report_btn, "button_small")
-
-        # View Failures button
-        self.view_failures_btn = ctk.CTkButton(self.head_frame, text="📊 View Failures", 
-                      fg_color="#e74c3c", command=lambda: app.show_failure_cases())
-        self.view_failures_btn.pack(side="right", padx=5)
-        self.register_widget(self.view_failures_btn, "button_small")
+        self._build_header("UDS Diagnostics", "uds", "UDS")
 
         # UDS Action Selection
         action_label = ctk.CTkLabel(self, text="UDS Action:")
@@ -1487,7 +1631,7 @@ class UDSFrame(ScalableFrame):
                                            "ecu_reset", "testerpresent", "security_seed",
                                            "dump_dids", "read_mem", "read_did"
                                        ],
-                                       fg_color="#1f538d", button_color="#1f538d", button_hover_color="#14375e",
+                                       **_DROPDOWN_STYLE,
                                        command=self.on_uds_action_change)
         self.uds_act.pack(pady=10, fill="x", padx=20)
         self.uds_act.set("discovery")
@@ -1499,7 +1643,7 @@ class UDSFrame(ScalableFrame):
         self.register_widget(dbc_label, "label")
 
         self.msg_select = ctk.CTkOptionMenu(self, values=["No DBC Loaded"], command=self.on_msg_select,
-                                            fg_color="#1f538d", button_color="#1f538d", button_hover_color="#14375e")
+                                            **_DROPDOWN_STYLE)
         self.msg_select.pack(pady=5, fill="x", padx=20)
         self.register_widget(self.msg_select, "dropdown")
 
@@ -1509,24 +1653,25 @@ class UDSFrame(ScalableFrame):
 
         # Target ID (for most UDS commands)
         target_label = ctk.CTkLabel(self.uds_params_frame, text="Target ID:")
-        target_label.pack(anchor="w")
+        target_label.grid(row=0, column=0, sticky="w")
         self.register_widget(target_label, "label")
 
         self.uds_tid = ctk.CTkEntry(self.uds_params_frame, placeholder_text="e.g., 0x733")
-        self.uds_tid.pack(fill="x", pady=5)
+        self.uds_tid.grid(row=1, column=0, sticky="ew", pady=5)
         self.register_widget(self.uds_tid, "entry")
 
         # Response ID (for most commands)
         self.uds_rid_label = ctk.CTkLabel(self.uds_params_frame, text="Response ID:")
-        self.uds_rid_label.pack(anchor="w", pady=(5, 0))
+        self.uds_rid_label.grid(row=2, column=0, sticky="w", pady=(5, 0))
         self.register_widget(self.uds_rid_label, "label")
 
         self.uds_rid = ctk.CTkEntry(self.uds_params_frame, placeholder_text="e.g., 0x633")
-        self.uds_rid.pack(fill="x", pady=5)
+        self.uds_rid.grid(row=3, column=0, sticky="ew", pady=5)
         self.register_widget(self.uds_rid, "entry")
 
         # ECU Reset Subfunction
         self.ecu_reset_frame = ctk.CTkFrame(self.uds_params_frame, fg_color="transparent")
+        self.ecu_reset_frame.grid(row=4, column=0, sticky="ew", pady=10)
         
         ecu_reset_label = ctk.CTkLabel(self.ecu_reset_frame, text="Reset Subfunction:")
         ecu_reset_label.pack(anchor="w", pady=(5, 0))
@@ -1538,6 +1683,7 @@ class UDSFrame(ScalableFrame):
 
         # Security Seed Parameters
         self.security_seed_frame = ctk.CTkFrame(self.uds_params_frame, fg_color="transparent")
+        self.security_seed_frame.grid(row=5, column=0, sticky="ew", pady=10)
         
         security_params_frame = ctk.CTkFrame(self.security_seed_frame, fg_color="transparent")
         security_params_frame.pack(fill="x", pady=5)
@@ -1578,6 +1724,7 @@ class UDSFrame(ScalableFrame):
 
         # DID Parameters for read_did
         self.did_frame = ctk.CTkFrame(self.uds_params_frame, fg_color="transparent")
+        self.did_frame.grid(row=6, column=0, sticky="ew", pady=10)
         
         did_label = ctk.CTkLabel(self.did_frame, text="DID (Hex):")
         did_label.pack(anchor="w", pady=(5, 0))
@@ -1589,6 +1736,7 @@ class UDSFrame(ScalableFrame):
 
         # Memory Read Parameters
         self.memory_frame = ctk.CTkFrame(self.uds_params_frame, fg_color="transparent")
+        self.memory_frame.grid(row=7, column=0, sticky="ew", pady=10)
         
         memory_params_frame = ctk.CTkFrame(self.memory_frame, fg_color="transparent")
         memory_params_frame.pack(fill="x", pady=5)
@@ -1611,6 +1759,7 @@ class UDSFrame(ScalableFrame):
 
         # DID Range Parameters for dump_dids
         self.did_range_frame = ctk.CTkFrame(self.uds_params_frame, fg_color="transparent")
+        self.did_range_frame.grid(row=8, column=0, sticky="ew", pady=10)
         
         did_range_params_frame = ctk.CTkFrame(self.did_range_frame, fg_color="transparent")
         did_range_params_frame.pack(fill="x", pady=5)
@@ -1638,6 +1787,7 @@ class UDSFrame(ScalableFrame):
         self.did_timeout = ctk.CTkEntry(self.did_range_frame, placeholder_text="0.1", width=100)
         self.did_timeout.pack(anchor="w", pady=5)
         self.register_widget(self.did_timeout, "entry")
+        self.uds_params_frame.grid_columnconfigure(0, weight=1)
 
         # UDS Options Frame
         self.uds_options_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -1645,15 +1795,16 @@ class UDSFrame(ScalableFrame):
 
         # Blacklist options (for discovery)
         self.blacklist_label = ctk.CTkLabel(self.uds_options_frame, text="Blacklist IDs (space separated):")
-        self.blacklist_label.pack(anchor="w", pady=(5, 0))
+        self.blacklist_label.grid(row=0, column=0, sticky="w", pady=(5, 0))
         self.register_widget(self.blacklist_label, "label")
 
         self.uds_blacklist = ctk.CTkEntry(self.uds_options_frame, placeholder_text="0x123 0x456")
-        self.uds_blacklist.pack(fill="x", pady=5)
+        self.uds_blacklist.grid(row=1, column=0, sticky="ew", pady=5)
         self.register_widget(self.uds_blacklist, "entry")
 
         # Auto blacklist
         self.autoblacklist_frame = ctk.CTkFrame(self.uds_options_frame, fg_color="transparent")
+        self.autoblacklist_frame.grid(row=2, column=0, sticky="ew", pady=5)
         
         self.autoblacklist_label = ctk.CTkLabel(self.autoblacklist_frame, text="Auto Blacklist Count:")
         self.autoblacklist_label.pack(side="left")
@@ -1662,6 +1813,7 @@ class UDSFrame(ScalableFrame):
         self.uds_autoblacklist = ctk.CTkEntry(self.autoblacklist_frame, placeholder_text="10", width=80)
         self.uds_autoblacklist.pack(side="left", padx=10)
         self.register_widget(self.uds_autoblacklist, "entry")
+        self.uds_options_frame.grid_columnconfigure(0, weight=1)
 
         # Extra Args
         extra_label = ctk.CTkLabel(self, text="Extra Args:")
@@ -1684,67 +1836,13 @@ class UDSFrame(ScalableFrame):
         self.uds_execute_btn.pack(pady=20, fill="x", padx=20)
         self.register_widget(self.uds_execute_btn, "button_large")
 
-        # Initialize UI based on default action
+        # Every optional widget starts gridded; the default action hides the rest
+        self._optional_shown = frozenset().union(*self.ACTION_WIDGETS.values())
         self.on_uds_action_change("discovery")
 
     def on_uds_action_change(self, selection):
         """Update UDS UI based on selected action"""
-        # Hide all optional elements first
-        self.uds_rid_label.pack_forget()
-        self.uds_rid.pack_forget()
-        self.ecu_reset_frame.pack_forget()
-        self.security_seed_frame.pack_forget()
-        self.security_options_frame.pack_forget()
-        self.did_frame.pack_forget()
-        self.memory_frame.pack_forget()
-        self.did_range_frame.pack_forget()
-        self.blacklist_label.pack_forget()
-        self.uds_blacklist.pack_forget()
-        self.autoblacklist_label.pack_forget()
-        self.autoblacklist_frame.pack_forget()
-        self.uds_autoblacklist.pack_forget()
-
-        # Show common elements
-        self.uds_tid.pack(fill="x", pady=5)
-
-        # Action-specific configurations
-        if selection == "discovery":
-            # Show blacklist options for discovery
-            self.blacklist_label.pack(anchor="w", pady=(5, 0))
-            self.uds_blacklist.pack(fill="x", pady=5)
-            
-            self.autoblacklist_label.pack(side="left")
-            self.uds_autoblacklist.pack(side="left", padx=10)
-            self.autoblacklist_frame.pack(fill="x", pady=5)
-
-        elif selection in ["services", "subservices", "dump_dids", "read_mem", "read_did"]:
-            # Show response ID for these commands
-            self.uds_rid_label.pack(anchor="w", pady=(5, 0))
-            self.uds_rid.pack(fill="x", pady=5)
-            
-            # Additional parameters for specific commands
-            if selection == "dump_dids":
-                self.did_range_frame.pack(fill="x", pady=10)
-            elif selection == "read_mem":
-                self.memory_frame.pack(fill="x", pady=10)
-            elif selection == "read_did":
-                self.did_frame.pack(fill="x", pady=10)
-
-        elif selection == "ecu_reset":
-            # Show response ID and reset subfunction
-            self.uds_rid_label.pack(anchor="w", pady=(5, 0))
-            self.uds_rid.pack(fill="x", pady=5)
-            self.ecu_reset_frame.pack(fill="x", pady=10)
-
-        elif selection == "testerpresent":
-            # Only target ID needed for testerpresent
-            pass
-
-        elif selection == "security_seed":
-            # Show response ID and security parameters
-            self.uds_rid_label.pack(anchor="w", pady=(5, 0))
-            self.uds_rid.pack(fill="x", pady=5)
-            self.security_seed_frame.pack(fill="x", pady=10)
+        self._show_optional(self.ACTION_WIDGETS.get(selection, frozenset()))
 
     def run_uds(self):
         """Execute UDS command"""
@@ -1833,7 +1931,8 @@ class UDSFrame(ScalableFrame):
         if action == "discovery":
             blacklist = self.uds_blacklist.get().strip()
             if blacklist:
-                cmd.extend(["-blacklist"] + blacklist.split())
+                cmd.append("-blacklist")
+                cmd.extend(blacklist.split())
 
             autoblacklist = self.uds_autoblacklist.get().strip()
             if autoblacklist:
@@ -1866,6 +1965,8 @@ class UDSFrame(ScalableFrame):
         
         # Update padding based on scale
         padding = FontConfig.get_padding(scale_factor)
+        if not self._scaling_changed("padding", padding):
+            return
         
         # Update frame padding
         self.uds_params_frame.pack_configure(pady=padding, padx=padding)
@@ -1905,29 +2006,8 @@ class AdvancedFrame(ScalableFrame):
     def __init__(self, parent, app):
         super().__init__(parent, app)
 
-        self.head_frame = ctk.CTkFrame(self, fg_color="transparent")
-        self.head_frame.pack(fill="x")
-
-        self.title_label = ctk.CTkLabel(self.head_frame, text="Advanced", font=FontConfig.get_title_font(1.0))
-        self.title_label.pack(side="left")
-        self.register_widget(self.title_label, "title")
-
-        # Buttons (Show help for all advanced modules)
-        self.help_btn = ctk.CTkButton(self.head_frame, text="❓", fg_color="#f39c12", text_color="white",
-                      command=lambda: app.show_module_help(["doip", "xcp", "uds"]))
-        self.help_btn.pack(side="right", padx=5)
-        self.register_widget(self.help_btn, "button_small")
-
-        self.report_btn = ctk.CTkButton(self.head_frame, text="📥 Report (PDF)",
-                      command=lambda: app.save_module_report("Advanced"))
-        self.report_btn.pack(side="right", padx=5)
-        self.register_widget(self.report_btn, "button_small")
-
-        # NEW: View Failures button
-        self.view_failures_btn = ctk.CTkButton(self.head_frame, text="📊 View Failures", 
-                      fg_color="#e74c3c", command=lambda: app.show_failure_cases())
-        self.view_failures_btn.pack(side="right", padx=5)
-        self.register_widget(self.view_failures_btn, "button_small")
+        # Help covers all advanced modules
+        self._build_header("Advanced", ["doip", "xcp", "uds"], "Advanced")
 
         # Create notebook for different advanced functions
         self.tabs = ctk.CTkTabview(self)
@@ -1951,9 +2031,27 @@ class AdvancedFrame(ScalableFrame):
         self.doip_btn.pack(fill="x", pady=5)
         self.register_widget(self.doip_btn, "button_large")
 
-        # Tab 2: XCP
+        # The other tabs are filled in on first visit; DoIP is shown first
         self.xcp_tab = self.tabs.add("XCP")
-
+        self.did_tab = self.tabs.add("DID Reader")
+        self.analyzer_tab = self.tabs.add("UDS Analyzer")
+        self._tab_builders = {
+            "XCP": self._build_xcp_tab,
+            "DID Reader": self._build_did_tab,
+            "UDS Analyzer": self._build_analyzer_tab,
+        }
+        self.tabs.configure(command=self._on_tab_change)
+
+    def _on_tab_change(self):
+        tab_name = self.tabs.get()
+        build = self._tab_builders.pop(tab_name, None)
+        if build is not None:
+            build()
+            # Catch up with any scaling applied before the tab existed
+            UIScaling.scale_frame_children(self.tabs.tab(tab_name), self._current_scale)
+
+    def _build_xcp_tab(self):
+        """Create the XCP widgets on first visit"""
         # XCP Section with interface checkbox
         self.xcp_frame = ctk.CTkFrame(self.xcp_tab, fg_color="transparent")
         self.xcp_frame.pack(fill="x", pady=10, padx=20)
@@ -1973,8 +2071,9 @@ class AdvancedFrame(ScalableFrame):
         self.xcp_btn.pack(pady=5, fill="x")
         self.register_widget(self.xcp_btn, "button_large")
 
-        # Tab 3: UDS DID Reader
-        self.did_tab = self.tabs.add("DID Reader")
+    def _build_did_tab(self):
+        """Create the UDS DID Reader widgets on first visit"""
+        mono_font = FontConfig.get_mono_font(1.0)
 
         # UDS DID Reader Section
         self.did_frame = ctk.CTkFrame(self.did_tab, fg_color="transparent")
@@ -1986,53 +2085,17 @@ class AdvancedFrame(ScalableFrame):
         self.register_widget(did_select_label, "label")
 
         self.did_select = ctk.CTkOptionMenu(self.did_frame,
-                                          values=[
-                                              "Single DID: 0xF190 - VIN (Vehicle ID)",
-                                              "Single DID: 0xF180 - Boot Software ID",
-                                              "Single DID: 0xF181 - Application Software ID",
-                                              "Single DID: 0xF186 - Active Session",
-                                              "Single DID: 0xF187 - Spare Part Number",
-                                              "Single DID: 0xF188 - ECU SW Number",
-                                              "Single DID: 0xF198 - Repair Shop Code",
-                                              "Single DID: 0xF18C - ECU Serial Number",
-                                              "Custom DID",
-                                              "Scan Range: 0xF180-0xF1FF (Manufacturer DIDs)"
-                                          ],
+                                          values=list(_DID_LABELS),
                                           command=self.on_did_selection_change,
-                                          fg_color="#1f538d", button_color="#1f538d", button_hover_color="#14375e")
+                                          **_DROPDOWN_STYLE)
         self.did_select.pack(pady=5, fill="x")
-        self.did_select.set("Single DID: 0xF190 - VIN (Vehicle ID)")
+        self.did_select.set(_DID_LABELS[0])
         self.register_widget(self.did_select, "dropdown")
 
-        # Custom DID entry (initially hidden)
-        self.custom_did_frame = ctk.CTkFrame(self.did_frame, fg_color="transparent")
-
-        custom_label = ctk.CTkLabel(self.custom_did_frame, text="Custom DID (Hex):")
-        custom_label.pack(anchor="w", pady=(0, 5))
-        self.register_widget(custom_label, "label")
-
-        self.custom_did_entry = ctk.CTkEntry(self.custom_did_frame, placeholder_text="e.g., F190 (without 0x)")
-        self.custom_did_entry.pack(pady=5, fill="x")
-        self.register_widget(self.custom_did_entry, "entry")
-
-        # Range scanning options (initially hidden)
-        self.range_frame = ctk.CTkFrame(self.did_frame, fg_color="transparent")
-
-        start_label = ctk.CTkLabel(self.range_frame, text="Start DID (Hex):")
-        start_label.pack(anchor="w", pady=(0, 5))
-        self.register_widget(start_label, "label")
-
-        self.start_did_entry = ctk.CTkEntry(self.range_frame, placeholder_text="F180")
-        self.start_did_entry.pack(pady=5, fill="x")
-        self.register_widget(self.start_did_entry, "entry")
-
-        end_label = ctk.CTkLabel(self.range_frame, text="End DID (Hex):")
-        end_label.pack(anchor="w", pady=(10, 5))
-        self.register_widget(end_label, "label")
-
-        self.end_did_entry = ctk.CTkEntry(self.range_frame, placeholder_text="F1FF")
-        self.end_did_entry.pack(pady=5, fill="x")
-        self.register_widget(self.end_did_entry, "entry")
+        # Custom DID entry and range scanning options are only built when
+        # first selected in the dropdown
+        self.custom_did_frame = None
+        self.range_frame = None
 
         # Target ID for UDS request
         target_label = ctk.CTkLabel(self.did_frame, text="Target ECU ID (Hex):")
@@ -2092,15 +2155,24 @@ class AdvancedFrame(ScalableFrame):
         self.register_widget(self.show_response_btn, "button_large")
 
         # NEW: Response display textbox
-        self.response_text = ctk.CTkTextbox(self.did_frame, height=200, font=FontConfig.get_mono_font(1.0))
+        self.response_text = ctk.CTkTextbox(self.did_frame, height=200, font=mono_font)
         self.response_text.pack(fill="both", expand=True, pady=(10, 0))
         self.register_widget(self.response_text, "textbox")
 
+        # Text queued for response_text, flushed in one insert per tick
+        self._pending_text = []
+        self._text_flush_scheduled = False
+
         # Initialize UI state
-        self.on_did_selection_change("Single DID: 0xF190 - VIN (Vehicle ID)")
+        self.on_did_selection_change(_DID_LABELS[0])
 
-        # Tab 4: UDS Response Analyzer
-        self.analyzer_tab = self.tabs.add("UDS Analyzer")
+    def _build_analyzer_tab(self):
+        """Create the UDS Response Analyzer widgets on first visit"""
+        mono_font = FontConfig.get_mono_font(1.0)
+        label_font = FontConfig.get_label_font(1.0)
+
+        # Bumped by every Analyze/Clear; reports from older runs are dropped
+        self._analysis_gen = 0
 
         # UDS Analyzer Frame
         self.analyzer_frame = ctk.CTkFrame(self.analyzer_tab, fg_color="transparent")
@@ -2118,11 +2190,11 @@ class AdvancedFrame(ScalableFrame):
         examples_label = ctk.CTkLabel(input_frame,
                                     text="Example format:\nvcan0  7E8   [8]  10 14 62 F1 90 46 55 43",
                                     text_color="#95a5a6",
-                                    font=FontConfig.get_label_font(1.0))
+                                    font=label_font)
         examples_label.pack(anchor="w", pady=(0, 5))
         self.register_widget(examples_label, "label")
 
-        self.uds_response_entry = ctk.CTkTextbox(input_frame, height=120, font=FontConfig.get_mono_font(1.0))
+        self.uds_response_entry = ctk.CTkTextbox(input_frame, height=120, font=mono_font)
         self.uds_response_entry.pack(fill="x", pady=5)
         self.register_widget(self.uds_response_entry, "textbox")
 
@@ -2131,13 +2203,13 @@ class AdvancedFrame(ScalableFrame):
         example_btn_frame.pack(fill="x", pady=5)
 
         self.load_vin_example_btn = ctk.CTkButton(example_btn_frame, text="VIN Example",
-                                                command=lambda: self.load_uds_example("vin"),
+                                                command=functools.partial(self.load_uds_example, "vin"),
                                                 fg_color="#3498db", width=120)
         self.load_vin_example_btn.pack(side="left", padx=(0, 5))
         self.register_widget(self.load_vin_example_btn, "button_small")
 
         self.load_boot_example_btn = ctk.CTkButton(example_btn_frame, text="Boot ID Example",
-                                                command=lambda: self.load_uds_example("boot"),
+                                                command=functools.partial(self.load_uds_example, "boot"),
                                                 fg_color="#3498db", width=120)
         self.load_boot_example_btn.pack(side="left", padx=5)
         self.register_widget(self.load_boot_example_btn, "button_small")
@@ -2163,19 +2235,63 @@ class AdvancedFrame(ScalableFrame):
         results_label.pack(anchor="w")
         self.register_widget(results_label, "label")
 
-        self.results_text = ctk.CTkTextbox(results_frame, font=FontConfig.get_mono_font(1.0))
+        self.results_text = ctk.CTkTextbox(results_frame, font=mono_font)
         self.results_text.pack(fill="both", expand=True, pady=5)
         self.register_widget(self.results_text, "textbox")
 
+    def _build_custom_did_frame(self):
+        """Create the custom DID entry on first use"""
+        self.custom_did_frame = ctk.CTkFrame(self.did_frame, fg_color="transparent")
+
+        custom_label = ctk.CTkLabel(self.custom_did_frame, text="Custom DID (Hex):")
+        custom_label.pack(anchor="w", pady=(0, 5))
+        self.register_widget(custom_label, "label")
+
+        self.custom_did_entry = ctk.CTkEntry(self.custom_did_frame, placeholder_text="e.g., F190 (without 0x)")
+        self.custom_did_entry.pack(pady=5, fill="x")
+        self.register_widget(self.custom_did_entry, "entry")
+
+        # Catch up with any scaling applied before the frame existed
+        UIScaling.scale_frame_children(self.custom_did_frame, self._current_scale)
+
+    def _build_range_frame(self):
+        """Create the range scanning options on first use"""
+        self.range_frame = ctk.CTkFrame(self.did_frame, fg_color="transparent")
+
+        start_label = ctk.CTkLabel(self.range_frame, text="Start DID (Hex):")
+        start_label.pack(anchor="w", pady=(0, 5))
+        self.register_widget(start_label, "label")
+
+        self.start_did_entry = ctk.CTkEntry(self.range_frame, placeholder_text="F180")
+        self.start_did_entry.pack(pady=5, fill="x")
+        self.register_widget(self.start_did_entry, "entry")
+
+        end_label = ctk.CTkLabel(self.range_frame, text="End DID (Hex):")
+        end_label.pack(anchor="w", pady=(10, 5))
+        self.register_widget(end_label, "label")
+
+        self.end_did_entry = ctk.CTkEntry(self.range_frame, placeholder_text="F1FF")
+        self.end_did_entry.pack(pady=5, fill="x")
+        self.register_widget(self.end_did_entry, "entry")
+
+        # Catch up with any scaling applied before the frame existed
+        UIScaling.scale_frame_children(self.range_frame, self._current_scale)
+
     def on_did_selection_change(self, selection):
         """Show/hide custom DID entry based on selection"""
         # Hide all optional frames first
-        self.custom_did_frame.pack_forget()
-        self.range_frame.pack_forget()
-
-        if selection == "Custom DID":
+        if self.custom_did_frame is not None:
+            self.custom_did_frame.pack_forget()
+        if self.range_frame is not None:
+            self.range_frame.pack_forget()
+
+        if selection == _DID_CUSTOM:
+            if self.custom_did_frame is None:
+                self._build_custom_did_frame()
             self.custom_did_frame.pack(fill="x", pady=10)
-        elif "Scan Range:" in selection:
+        elif selection == _DID_SCAN_RANGE:
+            if self.range_frame is None:
+                self._build_range_frame()
             # Pre-fill the range for manufacturer DIDs
             self.start_did_entry.delete(0, "end")
             self.end_did_entry.delete(0, "end")
@@ -2199,26 +2315,21 @@ class AdvancedFrame(ScalableFrame):
         # Get selected DID
         selection = self.did_select.get()
 
-        if selection == "Custom DID":
+        if selection == _DID_CUSTOM:
             did_hex = self.custom_did_entry.get().strip()
             if not did_hex:
                 messagebox.showerror("Error", "Please enter a custom DID")
                 return
-            # Remove 0x prefix if present
-            did_hex = did_hex.replace("0x", "")
-            # Ensure it's 4 hex digits
-            if len(did_hex) != 4:
+            m = _CUSTOM_DID_RE.fullmatch(did_hex)
+            if not m:
                 messagebox.showerror("Error", "DID must be 4 hex digits (e.g., F190)")
                 return
-            did_bytes = did_hex.upper()
+            did_bytes = m.group(1).upper()
 
-        elif "Single DID:" in selection:
-            # Extract DID from the option text
-            # e.g., "Single DID: 0xF190 - VIN (Vehicle ID)" -> "F190"
-            did_full = selection.split(": ")[1].split(" - ")[0]  # "0xF190"
-            did_bytes = did_full[2:].upper()  # "F190"
+        elif selection in _DID_LABEL_TO_HEX:
+            did_bytes = _DID_LABEL_TO_HEX[selection]
 
-        elif "Scan Range:" in selection:
+        elif selection == _DID_SCAN_RANGE:
             # For range scanning, use the dump_dids command
             self.read_did_range()
             return
@@ -2234,12 +2345,9 @@ class AdvancedFrame(ScalableFrame):
         #   f1.90 = DID (2 bytes, lowercase)
         #   00.00.00.00 = padding
 
-        # Parse the DID into two bytes
-        did_high_byte = did_bytes[0:2].lower()  # First 2 chars (e.g., "f1")
-        did_low_byte = did_bytes[2:4].lower()   # Last 2 chars (e.g., "90")
-
         # Create the CAN frame with lowercase hex
-        can_frame = f"{target_id}#03.22.{did_high_byte}.{did_low_byte}.00.00.00.00"
+        payload = b"\x03\x22" + bytes.fromhex(did_bytes) + bytes(4)
+        can_frame = f"{target_id}#{payload.hex('.')}"
 
         # Build the send command
         cmd = ["send", "message", can_frame]
@@ -2253,14 +2361,16 @@ class AdvancedFrame(ScalableFrame):
 
         # Show the command that was sent
         response_id = self.uds_response_id.get().strip() or "0x7E8"
-        self.app._console_write(f"\n📤 Sent UDS Request:\n")
-        self.app._console_write(f"   Service: 0x22 (Read Data By Identifier)\n")
-        self.app._console_write(f"   DID: 0x{did_bytes}\n")
-        self.app._console_write(f"   Raw Frame: {can_frame}\n")
-        self.app._console_write(f"   Expected Response on: {response_id}\n")
-        self.app._console_write(f"\n💡 Manual commands:\n")
-        self.app._console_write(f"   cansend vcan0 {target_id}#0322{did_bytes}00000000\n")
-        self.app._console_write(f"   python -m fucyfuzz.fucyfuzz send message {can_frame}\n")
+        self.app._console_write(
+            f"\n📤 Sent UDS Request:\n"
+            f"   Service: 0x22 (Read Data By Identifier)\n"
+            f"   DID: 0x{did_bytes}\n"
+            f"   Raw Frame: {can_frame}\n"
+            f"   Expected Response on: {response_id}\n"
+            f"\n💡 Manual commands:\n"
+            f"   cansend vcan0 {target_id}#{payload.hex().upper()}\n"
+            f"   python -m fucyfuzz.fucyfuzz send message {can_frame}\n"
+        )
 
         # Store the DID for later use in show_response
         self.last_did_hex = did_bytes
@@ -2273,11 +2383,7 @@ class AdvancedFrame(ScalableFrame):
         response_id = self.uds_response_id.get().strip()
 
         # Get timeout value (use default if not set)
-        timeout = "0.2"
-        if hasattr(self, 'timeout_entry'):
-            timeout_val = self.timeout_entry.get().strip()
-            if timeout_val:
-                timeout = timeout_val
+        timeout = self.timeout_entry.get().strip() or "0.2"
 
         if not target_id:
             messagebox.showerror("Error", "Please enter a Target ECU ID")
@@ -2290,7 +2396,7 @@ class AdvancedFrame(ScalableFrame):
         # Get range
         selection = self.did_select.get()
 
-        if selection == "Scan Range: 0xF180-0xF1FF (Manufacturer DIDs)":
+        if selection == _DID_SCAN_RANGE:
             min_did = "0xF180"
             max_did = "0xF1FF"
         else:
@@ -2313,17 +2419,15 @@ class AdvancedFrame(ScalableFrame):
         # Run the command
         self.app.run_command(cmd, "UDS_DID_Scanner")
 
-        # Also show manual examples for the first few DIDs in the range
-        self.app._console_write(f"\n📋 Manual examples for this range:\n")
-
-        # Show examples for first 3 DIDs in the range
+        # Also show manual examples for the first 3 DIDs in the range
+        examples = ""
         try:
             start_val = int(min_did, 16)
-            for i in range(3):
-                did_hex = f"{start_val + i:04X}"
-                self.app._console_write(f"   cansend vcan0 {target_id}#0322{did_hex}00000000\n")
+            examples = "".join(f"   cansend vcan0 {target_id}#0322{start_val + i:04X}00000000\n"
+                               for i in range(3))
         except:
             pass
+        self.app._console_write(f"\n📋 Manual examples for this range:\n{examples}")
 
     def show_did_response(self):
         """Show response for the last read DID using dump_dids command"""
@@ -2349,22 +2453,15 @@ class AdvancedFrame(ScalableFrame):
             response_id = "0x" + response_id
 
         # Clear previous response
+        self._pending_text.clear()
         self.response_text.delete("1.0", "end")
         self.response_text.insert("1.0", "Fetching response for DID 0x{}...\n".format(self.last_did_hex))
 
         # Get timeout value
-        timeout = "0.2"
-        if hasattr(self, 'timeout_entry'):
-            timeout_val = self.timeout_entry.get().strip()
-            if timeout_val:
-                timeout = timeout_val
+        timeout = self.timeout_entry.get().strip() or "0.2"
 
-        # Convert DID to hex integer
-        try:
-            did_int = int(self.last_did_hex, 16)
-        except ValueError:
-            self.response_text.insert("end", f"❌ Invalid DID format: 0x{self.last_did_hex}\n")
-            return
+        # read_did stores four validated, upper-case hex digits
+        did_arg = f"0x{self.last_did_hex}"
 
         # Build the dump_dids command for specific DID
         cmd = ["uds", "dump_dids", target_id]
@@ -2374,8 +2471,8 @@ class AdvancedFrame(ScalableFrame):
 
         # Add options for specific DID
         cmd.extend([
-            "--min_did", f"0x{did_int:04X}",
-            "--max_did", f"0x{did_int:04X}",
+            "--min_did", did_arg,
+            "--max_did", did_arg,
             "-t", timeout
         ])
 
@@ -2393,31 +2490,39 @@ class AdvancedFrame(ScalableFrame):
     def _execute_dump_dids(self, cmd):
         """Execute dump_dids command and show results in response_text"""
         working_dir = self.app.working_dir
-        env = os.environ.copy()
-        env["PYTHONPATH"] = working_dir + os.pathsep + env.get("PYTHONPATH", "")
+        env = self.app._subprocess_env()
 
         try:
             # Build the full command
-            full_cmd = [sys.executable, "-m", "fucyfuzz.fucyfuzz"] + cmd
+            full_cmd = self.app._cached_cmd_prefix + cmd
 
             # Run subprocess
             process = subprocess.Popen(
                 full_cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
                 cwd=working_dir,
-                env=env,
-                universal_newlines=True
+                env=env
             )
 
-            # Read output in real-time
+            # Read output in real-time, one chunk of whatever is available per
+            # read instead of one line, so bursts reach the UI as one update
+            decoder = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True)
             output_lines = []
-            for line in iter(process.stdout.readline, ''):
-                output_lines.append(line)
-                # Update UI with each line
-                self.after(0, self._update_response_text, line)
+            partial = ""
+            while True:
+                chunk = process.stdout.read1(65536)
+                text = decoder.decode(chunk, final=not chunk)
+                if text:
+                    # Keep complete lines for the decoder, carry the rest over
+                    *lines, partial = (partial + text).split("\n")
+                    output_lines.extend(line + "\n" for line in lines)
+                    self.after(0, self._update_response_text, text)
+                if not chunk:
+                    break
+            if partial:
+                output_lines.append(partial)
 
             process.wait()
 
@@ -2425,9 +2530,8 @@ class AdvancedFrame(ScalableFrame):
             if process.returncode == 0:
                 self.after(0, self._update_response_text, f"\n✅ Command completed successfully (Exit code: {process.returncode})\n")
 
-                # NEW: Decode the response after completion
-                full_output = "".join(output_lines)
-                self.after(0, self._decode_uds_response, full_output)
+                # Decode here in the worker; the report reaches the UI as one update
+                self.after(0, self._update_response_text, self._decode_uds_response(output_lines))
 
             else:
                 self.after(0, self._update_response_text, f"\n⚠️ Command completed with errors (Exit code: {process.returncode})\n")
@@ -2436,368 +2540,220 @@ class AdvancedFrame(ScalableFrame):
             error_msg = f"\n❌ Error running command: {str(e)}\n"
             self.after(0, self._update_response_text, error_msg)
 
-    def _decode_uds_response(self, full_output):
-        """Decode UDS response from dump_dids output"""
+    def _decode_uds_response(self, output_lines):
+        """Decode UDS response from the dump_dids output lines into one report"""
+        out = []
+
         # Add separator
-        self.after(0, self._update_response_text, "\n" + "="*70 + "\n")
-        self.after(0, self._update_response_text, "📊 UDS RESPONSE DECODER\n")
-        self.after(0, self._update_response_text, "="*70 + "\n\n")
+        out.append("\n" + "="*70 + "\n")
+        out.append("📊 UDS RESPONSE DECODER\n")
+        out.append("="*70 + "\n\n")
 
         # Look for DID data in the output
-        lines = full_output.split('\n')
         decoded_data = []
         current_did = None
-        current_data = []
+        current_data = b""
 
-        for line in lines:
-            line = line.strip()
+        for line in output_lines:
+            # Look for DID lines; the regex needs no lowercased or stripped copy
+            match = _DID_LINE_RE.match(line)
+            if not match:
+                continue
+
+            current_did = match.group(1).upper()
+            out.append(f"🔍 Found DID: 0x{current_did}\n")
 
-            # Look for DID lines
-            if "0x" in line and ("f1" in line.lower() or "f2" in line.lower()):
-                # Try to parse DID and data
-                parts = line.split()
-                for part in parts:
-                    if part.lower().startswith("0xf"):
-                        # Found a DID
-                        try:
-                            did_hex = part.lower().replace("0x", "")
-                            if len(did_hex) == 4:  # Valid DID
-                                current_did = did_hex.upper()
-                                self.after(0, self._update_response_text, f"🔍 Found DID: 0x{current_did}\n")
-
-                                # Look for data bytes in the same line
-                                data_start = line.lower().find(did_hex.lower()) + 4
-                                rest_of_line = line[data_start:].strip()
-
-                                # Extract hex bytes (2 chars each)
-                                data_bytes = []
-                                for i in range(0, len(rest_of_line), 2):
-                                    if i+2 <= len(rest_of_line):
-                                        byte_str = rest_of_line[i:i+2]
-                                        if byte_str.isalnum() and len(byte_str) == 2:
-                                            try:
-                                                data_bytes.append(int(byte_str, 16))
-                                            except:
-                                                pass
-
-                                if data_bytes:
-                                    current_data = data_bytes
-                                    self._decode_did_data(current_did, current_data)
-                                break
-                        except:
-                            continue
+            # Data bytes follow the DID as one run; drop any separators
+            data_bytes = bytes.fromhex("".join(match.group(2).split()))
+            if data_bytes:
+                current_data = data_bytes
+                self._decode_did_data(current_did, current_data, out)
 
         # If no DID found in the output, check for raw hex data
         if not decoded_data:
             # Look for any hex data in the output
-            all_hex_data = []
-            for line in lines:
-                # Extract hex bytes (2 chars each)
-                hex_parts = []
-                line = line.strip()
-
-                # Split by spaces and look for hex strings
-                for word in line.split():
-                    if len(word) == 2 and all(c in "0123456789abcdefABCDEF" for c in word):
-                        try:
-                            hex_parts.append(int(word, 16))
-                        except:
-                            pass
-
-                if hex_parts:
-                    all_hex_data.extend(hex_parts)
+            all_hex_data = bytearray()
+            for line in output_lines:
+                # Split by spaces and look for hex strings (2 chars each)
+                hex_words = [word for word in line.split()
+                             if len(word) == 2 and word[0] in _HEX_DIGITS and word[1] in _HEX_DIGITS]
+                if hex_words:
+                    all_hex_data += bytes.fromhex(" ".join(hex_words))
 
             if all_hex_data:
-                self.after(0, self._update_response_text, "📋 Raw hex data found:\n")
-                self.after(0, self._update_response_text, f"   Hex: {' '.join(f'{b:02X}' for b in all_hex_data)}\n")
+                out.append("📋 Raw hex data found:\n")
+                out.append(f"   Hex: {all_hex_data.hex(' ').upper()}\n")
 
                 # Try to decode as UDS response
-                self._decode_uds_bytes(all_hex_data)
+                self._decode_uds_bytes(all_hex_data, out)
 
         # Show quick reference
-        self.after(0, self._update_response_text, "\n" + "="*70 + "\n")
-        self.after(0, self._update_response_text, "📚 UDS RESPONSE FORMAT REFERENCE:\n\n")
-
-        # Positive Response (0x62) format
-        self.after(0, self._update_response_text, "✅ Positive Response (0x62) format:\n")
-        self.after(0, self._update_response_text, "   Byte 0: 0x10 (First Frame)\n")
-        self.after(0, self._update_response_text, "   Byte 1: Total data length (n)\n")
-        self.after(0, self._update_response_text, "   Byte 2: 0x62 (Positive response to service 0x22)\n")
-        self.after(0, self._update_response_text, "   Byte 3-4: DID (2 bytes, e.g., F1 90)\n")
-        self.after(0, self._update_response_text, "   Byte 5+: Data payload\n\n")
-
-        # Negative Response (0x7F) format
-        self.after(0, self._update_response_text, "❌ Negative Response (0x7F) format:\n")
-        self.after(0, self._update_response_text, "   Byte 0: 0x10 (First Frame)\n")
-        self.after(0, self._update_response_text, "   Byte 1: 0x03 (Length)\n")
-        self.after(0, self._update_response_text, "   Byte 2: 0x7F (Negative response)\n")
-        self.after(0, self._update_response_text, "   Byte 3: Requested service (e.g., 0x22)\n")
-        self.after(0, self._update_response_text, "   Byte 4: NRC (Negative Response Code)\n\n")
-
-        # Common NRC codes
-        self.after(0, self._update_response_text, "🔧 Common NRC Codes:\n")
-        nrc_codes = {
-            0x11: "0x11 - Service not supported",
-            0x12: "0x12 - Sub-function not supported",
-            0x13: "0x13 - Incorrect message length or format",
-            0x22: "0x22 - Conditions not correct",
-            0x31: "0x31 - Request out of range",
-            0x33: "0x33 - Security access denied",
-            0x35: "0x35 - Invalid key",
-            0x78: "0x78 - Response pending"
-        }
+        out.append(_UDS_FORMAT_REFERENCE)
 
-        for code, desc in nrc_codes.items():
-            self.after(0, self._update_response_text, f"   {desc}\n")
-
-        self.after(0, self._update_response_text, "="*70 + "\n")
-
-    def _decode_did_data(self, did_hex, data_bytes):
-        """Decode specific DID data"""
-        did_map = {
-            "F190": "VIN (Vehicle Identification Number)",
-            "F180": "Boot Software ID",
-            "F181": "Application Software ID",
-            "F186": "Active Session",
-            "F187": "Spare Part Number",
-            "F188": "ECU SW Number",
-            "F198": "Repair Shop Code",
-            "F18C": "ECU Serial Number"
-        }
+        return "".join(out)
+
+    @staticmethod
+    def _payload_to_ascii(payload):
+        """Dotted ASCII view of a payload, or None if nothing in it is printable"""
+        if any(payload.translate(_PRINTABLE_SIEVE)):
+            return payload.translate(_ASCII_DOTTED).decode("latin-1")
+        return None
 
-        did_name = did_map.get(did_hex.upper(), "Unknown DID")
-        self.after(0, self._update_response_text, f"📝 DID 0x{did_hex}: {did_name}\n")
+    def _decode_did_data(self, did_hex, data_bytes, out):
+        """Decode specific DID data, appending the text to out"""
+        did_name = _DID_NAMES.get(int(did_hex, 16), "Unknown DID")
+        out.append(f"📝 DID 0x{did_hex}: {did_name}\n")
 
         # Decode based on DID type
         if did_hex.upper() == "F190":  # VIN
             # VIN is ASCII encoded
-            ascii_data = ""
-            for byte in data_bytes:
-                if 32 <= byte <= 126:  # Printable ASCII
-                    ascii_data += chr(byte)
-                elif byte == 0x00:
-                    ascii_data += "·"
-                else:
-                    ascii_data += f"\\x{byte:02X}"
+            ascii_data = _escaped_ascii(data_bytes)
 
-            self.after(0, self._update_response_text, f"   Decoded VIN: {ascii_data}\n")
-            self.after(0, self._update_response_text, f"   Raw hex: {' '.join(f'{b:02X}' for b in data_bytes)}\n")
+            out.append(f"   Decoded VIN: {ascii_data}\n")
+            out.append(f"   Raw hex: {data_bytes.hex(' ').upper()}\n")
 
         elif did_hex.upper() in ["F180", "F181", "F187", "F188", "F18C"]:
             # Software IDs are usually ASCII
-            ascii_data = ""
-            hex_data = []
-            for byte in data_bytes:
-                if 32 <= byte <= 126:  # Printable ASCII
-                    ascii_data += chr(byte)
-                    hex_data.append(f"{byte:02X}")
-                elif byte == 0x00:
-                    ascii_data += "·"
-                    hex_data.append("00")
-                else:
-                    ascii_data += f"\\x{byte:02X}"
-                    hex_data.append(f"{byte:02X}")
+            ascii_data = _escaped_ascii(data_bytes)
 
             if ascii_data:
-                self.after(0, self._update_response_text, f"   ASCII: {ascii_data}\n")
-            self.after(0, self._update_response_text, f"   Hex: {' '.join(hex_data)}\n")
+                out.append(f"   ASCII: {ascii_data}\n")
+            out.append(f"   Hex: {data_bytes.hex(' ').upper()}\n")
 
         else:
             # Generic hex display
-            self.after(0, self._update_response_text, f"   Hex data: {' '.join(f'{b:02X}' for b in data_bytes)}\n")
+            out.append(f"   Hex data: {data_bytes.hex(' ').upper()}\n")
 
             # Try ASCII conversion anyway
-            ascii_data = ""
-            for byte in data_bytes:
-                if 32 <= byte <= 126:
-                    ascii_data += chr(byte)
-                elif byte == 0x00:
-                    ascii_data += "·"
-                else:
-                    ascii_data += "."
-
-            if ascii_data.replace(".", "").replace("·", ""):
-                self.after(0, self._update_response_text, f"   ASCII attempt: {ascii_data}\n")
+            ascii_data = self._payload_to_ascii(data_bytes)
+            if ascii_data:
+                out.append(f"   ASCII attempt: {ascii_data}\n")
 
-    def _decode_uds_bytes(self, data_bytes):
-        """Decode UDS protocol bytes"""
+    def _decode_uds_bytes(self, data_bytes, out):
+        """Decode UDS protocol bytes, appending the text to out"""
         if not data_bytes:
             return
 
-        self.after(0, self._update_response_text, "\n🔬 UDS Protocol Analysis:\n")
+        out.append("\n🔬 UDS Protocol Analysis:\n")
 
         # Check first byte for frame type
         first_byte = data_bytes[0]
 
         if first_byte == 0x10:  # First frame
-            self.after(0, self._update_response_text, "   Frame Type: First Frame (Multi-frame response)\n")
+            out.append("   Frame Type: First Frame (Multi-frame response)\n")
 
             if len(data_bytes) >= 2:
                 total_len = data_bytes[1]
-                self.after(0, self._update_response_text, f"   Total Data Length: {total_len} bytes\n")
+                out.append(f"   Total Data Length: {total_len} bytes\n")
 
             if len(data_bytes) >= 3:
                 service = data_bytes[2]
-                service_name = {
-                    0x62: "Positive Response to Read Data By Identifier (0x22)",
-                    0x7F: "Negative Response",
-                    0x67: "Positive Response to Security Access (0x27)",
-                    0x6E: "Positive Response to Tester Present (0x3E)"
-                }.get(service, f"Unknown service 0x{service:02X}")
-                self.after(0, self._update_response_text, f"   Service: 0x{service:02X} ({service_name})\n")
+                service_name = _RESPONSE_NAMES.get(service, f"Unknown service 0x{service:02X}")
+                out.append(f"   Service: 0x{service:02X} ({service_name})\n")
 
                 if service == 0x62 and len(data_bytes) >= 5:
                     # Positive response to DID read
-                    did = (data_bytes[3] << 8) | data_bytes[4]
-                    self.after(0, self._update_response_text, f"   DID: 0x{did:04X}\n")
+                    did = int.from_bytes(data_bytes[3:5], "big")
+                    out.append(f"   DID: 0x{did:04X}\n")
 
                     # Extract data payload
                     if len(data_bytes) > 5:
                         payload = data_bytes[5:]
-                        self.after(0, self._update_response_text, f"   Payload ({len(payload)} bytes): {' '.join(f'{b:02X}' for b in payload)}\n")
+                        out.append(f"   Payload ({len(payload)} bytes): {payload.hex(' ').upper()}\n")
 
                         # Try to decode payload
-                        ascii_payload = ""
-                        for byte in payload:
-                            if 32 <= byte <= 126:
-                                ascii_payload += chr(byte)
-                            elif byte == 0x00:
-                                ascii_payload += "·"
-                            else:
-                                ascii_payload += "."
-
-                        if ascii_payload.replace(".", "").replace("·", ""):
-                            self.after(0, self._update_response_text, f"   Payload ASCII: {ascii_payload}\n")
+                        ascii_payload = self._payload_to_ascii(payload)
+                        if ascii_payload:
+                            out.append(f"   Payload ASCII: {ascii_payload}\n")
 
                 elif service == 0x7F and len(data_bytes) >= 5:
                     # Negative response
                     failed_service = data_bytes[3]
                     nrc = data_bytes[4]
 
-                    nrc_codes = {
-                        0x11: "Service not supported",
-                        0x12: "Sub-function not supported",
-                        0x13: "Incorrect message length or format",
-                        0x22: "Conditions not correct",
-                        0x31: "Request out of range",
-                        0x33: "Security access denied",
-                        0x35: "Invalid key",
-                        0x78: "Response pending"
-                    }
 
-                    self.after(0, self._update_response_text, f"   Failed Service: 0x{failed_service:02X}\n")
-                    self.after(0, self._update_response_text, f"   NRC: 0x{nrc:02X} - {nrc_codes.get(nrc, 'Unknown error')}\n")
+                    out.append(f"   Failed Service: 0x{failed_service:02X}\n")
+                    out.append(f"   NRC: 0x{nrc:02X} - {_NRC_CODES.get(nrc, 'Unknown error')}\n")
 
         elif (first_byte & 0xF0) == 0x20:  # Continuation frame
             frame_num = first_byte & 0x0F
-            self.after(0, self._update_response_text, f"   Frame Type: Continuation Frame {frame_num}\n")
+            out.append(f"   Frame Type: Continuation Frame {frame_num}\n")
 
             # Extract data
             payload = data_bytes[1:] if len(data_bytes) > 1 else []
             if payload:
-                self.after(0, self._update_response_text, f"   Payload ({len(payload)} bytes): {' '.join(f'{b:02X}' for b in payload)}\n")
+                out.append(f"   Payload ({len(payload)} bytes): {payload.hex(' ').upper()}\n")
 
                 # Try ASCII
-                ascii_payload = ""
-                for byte in payload:
-                    if 32 <= byte <= 126:
-                        ascii_payload += chr(byte)
-                    elif byte == 0x00:
-                        ascii_payload += "·"
-                    else:
-                        ascii_payload += "."
-
-                if ascii_payload.replace(".", "").replace("·", ""):
-                    self.after(0, self._update_response_text, f"   Payload ASCII: {ascii_payload}\n")
+                ascii_payload = self._payload_to_ascii(payload)
+                if ascii_payload:
+                    out.append(f"   Payload ASCII: {ascii_payload}\n")
 
         elif first_byte == 0x7F:  # Negative response (single frame)
-            self.after(0, self._update_response_text, "   Frame Type: Negative Response (Single Frame)\n")
+            out.append("   Frame Type: Negative Response (Single Frame)\n")
 
             if len(data_bytes) >= 3:
                 failed_service = data_bytes[1]
                 nrc = data_bytes[2]
 
-                nrc_codes = {
-                    0x11: "Service not supported",
-                    0x12: "Sub-function not supported",
-                    0x13: "Incorrect message length or format",
-                    0x22: "Conditions not correct",
-                    0x31: "Request out of range",
-                    0x33: "Security access denied",
-                    0x35: "Invalid key",
-                    0x78: "Response pending"
-                }
 
-                self.after(0, self._update_response_text, f"   Failed Service: 0x{failed_service:02X}\n")
-                self.after(0, self._update_response_text, f"   NRC: 0x{nrc:02X} - {nrc_codes.get(nrc, 'Unknown error')}\n")
+                out.append(f"   Failed Service: 0x{failed_service:02X}\n")
+                out.append(f"   NRC: 0x{nrc:02X} - {_NRC_CODES.get(nrc, 'Unknown error')}\n")
 
         else:
             # Single frame response
             if len(data_bytes) >= 3:
                 service = data_bytes[0]
-                did_high = data_bytes[1]
-                did_low = data_bytes[2]
-                did = (did_high << 8) | did_low
+                did = int.from_bytes(data_bytes[1:3], "big")
 
-                service_name = {
-                    0x62: "Positive Response to Read Data By Identifier (0x22)",
-                }.get(service, f"Unknown service 0x{service:02X}")
+                if service == 0x62:
+                    service_name = _RESPONSE_NAMES[service]
+                else:
+                    service_name = f"Unknown service 0x{service:02X}"
 
-                self.after(0, self._update_response_text, f"   Service: 0x{service:02X} ({service_name})\n")
-                self.after(0, self._update_response_text, f"   DID: 0x{did:04X}\n")
+                out.append(f"   Service: 0x{service:02X} ({service_name})\n")
+                out.append(f"   DID: 0x{did:04X}\n")
 
                 if len(data_bytes) > 3:
                     payload = data_bytes[3:]
-                    self.after(0, self._update_response_text, f"   Payload ({len(payload)} bytes): {' '.join(f'{b:02X}' for b in payload)}\n")
+                    out.append(f"   Payload ({len(payload)} bytes): {payload.hex(' ').upper()}\n")
 
                     # Try ASCII
-                    ascii_payload = ""
-                    for byte in payload:
-                        if 32 <= byte <= 126:
-                            ascii_payload += chr(byte)
-                        elif byte == 0x00:
-                            ascii_payload += "·"
-                        else:
-                            ascii_payload += "."
-
-                    if ascii_payload.replace(".", "").replace("·", ""):
-                        self.after(0, self._update_response_text, f"   Payload ASCII: {ascii_payload}\n")
+                    ascii_payload = self._payload_to_ascii(payload)
+                    if ascii_payload:
+                        out.append(f"   Payload ASCII: {ascii_payload}\n")
             else:
-                self.after(0, self._update_response_text, f"   Unknown frame format\n")
-                self.after(0, self._update_response_text, f"   Raw bytes: {' '.join(f'{b:02X}' for b in data_bytes)}\n")
+                out.append(f"   Unknown frame format\n")
+                out.append(f"   Raw bytes: {data_bytes.hex(' ').upper()}\n")
 
     def _update_response_text(self, text):
-        """Update response textbox with new text"""
+        """Queue text for the response textbox"""
+        self._pending_text.append(text)
+        if not self._text_flush_scheduled:
+            self._text_flush_scheduled = True
+            # ~30 Hz, so a burst of output costs one insert and one redraw
+            self.after(33, self._flush_pending_text)
+
+    def _flush_pending_text(self):
+        """Write all queued text to the response textbox at once"""
+        self._text_flush_scheduled = False
+        if not self._pending_text:
+            return
+        text = "".join(self._pending_text)
+        self._pending_text.clear()
         self.response_text.insert("end", text)
         self.response_text.see("end")
 
     def load_uds_example(self, example_type):
         """Load example UDS responses"""
-        examples = {
-            "vin": """vcan0  7E8   [8]  10 14 62 F1 90 46 55 43
-vcan0  7E8   [8]  21 59 54 45 43 48 2D 56
-vcan0  7E8   [8]  22 49 4E 2D 30 30 30 31""",
-
-            "boot": """vcan0  7E8   [8]  10 0E 62 F1 80 46 55 43
-vcan0  7E8   [8]  21 59 2D 42 4F 4F 54 2D
-vcan0  7E8   [8]  22 56 31 2E 30 00 00 00""",
-
-            "app": """vcan0  7E8   [8]  10 10 62 F1 81 46 55 43
-vcan0  7E8   [8]  21 59 2D 41 50 50 2D 56
-vcan0  7E8   [8]  22 32 2E 35 2E 31 00 00""",
-
-            "serial": """vcan0  7E8   [8]  10 12 62 F1 8C 53 4E 2D
-vcan0  7E8   [8]  21 46 55 43 59 2D 38 38
-vcan0  7E8   [8]  22 38 38 38 38 38 38 38"""
-        }
-
-        if example_type in examples:
+        if example_type in _UDS_EXAMPLES:
             self.uds_response_entry.delete("1.0", "end")
-            self.uds_response_entry.insert("1.0", examples[example_type])
+            self.uds_response_entry.insert("1.0", _UDS_EXAMPLES[example_type])
             messagebox.showinfo("Example Loaded", f"Loaded {example_type.upper()} response example")
 
     def clear_uds_input(self):
         """Clear the UDS response input"""
+        self._analysis_gen += 1
         self.uds_response_entry.delete("1.0", "end")
         self.results_text.delete("1.0", "end")
 
@@ -2809,6 +2765,26 @@ vcan0  7E8   [8]  22 38 38 38 38 38 38 38"""
             messagebox.showwarning("Warning", "Please paste UDS response data")
             return
 
+        # Parse and format in a worker so large pastes don't freeze the UI
+        self._analysis_gen += 1
+        threading.Thread(target=self._analyze_uds_worker, args=(raw_text, self._analysis_gen),
+                         daemon=True).start()
+
+    def _analyze_uds_worker(self, raw_text, gen):
+        """Build the analysis report off the UI thread and hand it back"""
+        result = self._format_uds_analysis(raw_text)
+        self.after(0, self._show_analysis_result, result, gen)
+
+    def _show_analysis_result(self, result, gen):
+        """Display an analysis report, unless a newer Analyze or Clear superseded it"""
+        if gen != self._analysis_gen:
+            return
+        self.results_text.delete("1.0", "end")
+        self.results_text.insert("1.0", result)
+
+    @staticmethod
+    def _format_uds_analysis(raw_text):
+        """Decode pasted UDS response frames into a text report"""
         lines = raw_text.split('\n')
         frames = []
 
@@ -2819,191 +2795,116 @@ vcan0  7E8   [8]  22 38 38 38 38 38 38 38"""
                 continue
 
             # Look for data bytes in typical candump format
-            if '[' in line and ']' in line:
-                # Extract data bytes part (after the closing bracket)
-                parts = line.split(']')
-                if len(parts) > 1:
-                    hex_part = parts[1].strip()
-                    if hex_part:
-                        try:
-                            # Convert hex string to bytes
-                            bytes_list = [int(b, 16) for b in hex_part.split() if b]
-                            if bytes_list:  # Only add if we found bytes
-                                frames.append(bytes_list)
-                        except ValueError as e:
-                            continue
+            match = _CANDUMP_RE.search(line)
+            if match:
+                # Convert the whole data part in one go
+                frames.append(bytes.fromhex(match.group(1)))
 
         if not frames:
             # Try alternative format - just hex bytes
-            all_bytes = []
+            all_bytes = bytearray()
             for line in lines:
                 try:
-                    bytes_list = [int(b, 16) for b in line.split() if len(b) == 2]
-                    if bytes_list:
-                        all_bytes.extend(bytes_list)
-                except:
+                    all_bytes += bytes.fromhex(" ".join(b for b in line.split() if len(b) == 2))
+                except ValueError:
                     continue
 
             if all_bytes:
-                # Group bytes into frames of 8
-                for i in range(0, len(all_bytes), 8):
-                    frames.append(all_bytes[i:i+8])
+                # Group bytes into frames of 8, slicing a view instead of copying
+                view = memoryview(all_bytes)
+                frames.extend(bytes(view[i:i+8]) for i in range(0, len(view), 8))
 
         if not frames:
-            self.results_text.delete("1.0", "end")
-            self.results_text.insert("1.0", "❌ No valid data found. Please check format.\n\nExpected format:\nvcan0  7E8   [8]  10 14 62 F1 90 46 55 43")
-            return
+            return "❌ No valid data found. Please check format.\n\nExpected format:\nvcan0  7E8   [8]  10 14 62 F1 90 46 55 43"
 
         # Analyze frames
-        result = "=" * 60 + "\n"
-        result += "               UDS RESPONSE ANALYZER\n"
-        result += "=" * 60 + "\n\n"
+        parts = ["=" * 60 + "\n"]
+        parts.append("               UDS RESPONSE ANALYZER\n")
+        parts.append("=" * 60 + "\n\n")
 
-        total_ascii = ""
+        total_data = bytearray()  # Message bytes across frames, NUL padding dropped
 
         for i, frame_bytes in enumerate(frames):
-            result += f"📦 FRAME {i+1} ({len(frame_bytes)} bytes):\n"
-            result += f"   Hex: {' '.join(f'{b:02X}' for b in frame_bytes)}\n"
+            parts.append(f"📦 FRAME {i+1} ({len(frame_bytes)} bytes):\n")
+            parts.append(f"   Hex: {frame_bytes.hex(' ').upper()}\n")
 
             # Check first byte for frame type
             first_byte = frame_bytes[0]
 
             if first_byte == 0x10:  # First frame
-                result += "   Type: First Frame (Multi-frame response)\n"
+                parts.append("   Type: First Frame (Multi-frame response)\n")
 
                 if len(frame_bytes) >= 2:
                     total_len = frame_bytes[1]
-                    result += f"   Total Data Length: {total_len} bytes\n"
+                    parts.append(f"   Total Data Length: {total_len} bytes\n")
 
                 if len(frame_bytes) >= 3:
                     service = frame_bytes[2]
-                    service_name = {
-                        0x62: "Read Data By Identifier (0x22)",
-                        0x7F: "Negative Response",
-                        0x67: "Security Access (0x27)",
-                        0x6E: "Tester Present (0x3E)"
-                    }.get(service, f"Unknown service 0x{service:02X}")
-                    result += f"   Service: 0x{service:02X} ({service_name})\n"
+                    service_name = _SERVICE_NAMES.get(service, f"Unknown service 0x{service:02X}")
+                    parts.append(f"   Service: 0x{service:02X} ({service_name})\n")
 
                 if len(frame_bytes) >= 5:
-                    did = (frame_bytes[3] << 8) | frame_bytes[4]
-                    did_info = {
-                        0xF190: "VIN (Vehicle Identification Number)",
-                        0xF180: "Boot Software ID",
-                        0xF181: "Application Software ID",
-                        0xF187: "Spare Part Number",
-                        0xF18C: "ECU Serial Number",
-                        0xF186: "Active Session",
-                        0xF188: "ECU SW Number",
-                        0xF198: "Repair Shop Code"
-                    }
-
-                    result += f"   DID: 0x{did:04X}"
-                    if did in did_info:
-                        result += f" - {did_info[did]}\n"
+                    did = int.from_bytes(frame_bytes[3:5], "big")
+                    parts.append(f"   DID: 0x{did:04X}")
+                    if did in _DID_NAMES:
+                        parts.append(f" - {_DID_NAMES[did]}\n")
                     else:
-                        result += f" (Unknown DID)\n"
+                        parts.append(f" (Unknown DID)\n")
 
                 # Extract ASCII data from first frame
                 if len(frame_bytes) > 5:
-                    ascii_part = ""
-                    for byte in frame_bytes[5:]:
-                        if 32 <= byte <= 126:  # Printable ASCII
-                            ascii_part += chr(byte)
-                        elif byte == 0x00:
-                            ascii_part += "·"  # Show null as dot
-                        else:
-                            ascii_part += f"\\x{byte:02X}"
+                    ascii_part = _escaped_ascii(frame_bytes[5:])
 
                     if ascii_part:
-                        result += f"   Data: {ascii_part}\n"
-                        total_ascii += ascii_part.replace("·", "")
+                        parts.append(f"   Data: {ascii_part}\n")
+                        total_data += frame_bytes[5:].replace(b"\x00", b"")
 
             elif (first_byte & 0xF0) == 0x20:  # Continuation frame
                 frame_num = first_byte & 0x0F
-                result += f"   Type: Continuation Frame {frame_num}\n"
+                parts.append(f"   Type: Continuation Frame {frame_num}\n")
 
                 # Extract ASCII data from continuation frame
-                ascii_part = ""
-                for byte in frame_bytes[1:]:
-                    if 32 <= byte <= 126:  # Printable ASCII
-                        ascii_part += chr(byte)
-                        total_ascii += chr(byte)
-                    elif byte == 0x00:
-                        ascii_part += "·"
-                    else:
-                        ascii_part += f"\\x{byte:02X}"
-                        total_ascii += f"\\x{byte:02X}"
+                ascii_part = _escaped_ascii(frame_bytes[1:])
+                total_data += frame_bytes[1:].replace(b"\x00", b"")
 
                 if ascii_part:
-                    result += f"   Data: {ascii_part}\n"
+                    parts.append(f"   Data: {ascii_part}\n")
 
             elif first_byte == 0x7F:  # Negative response
-                result += "   Type: Negative Response\n"
+                parts.append("   Type: Negative Response\n")
                 if len(frame_bytes) >= 3:
                     failed_service = frame_bytes[1]
                     nrc = frame_bytes[2]
-                    nrc_codes = {
-                        0x11: "Service not supported",
-                        0x12: "Sub-function not supported",
-                        0x13: "Incorrect message length or format",
-                        0x22: "Conditions not correct",
-                        0x31: "Request out of range",
-                        0x33: "Security access denied",
-                        0x35: "Invalid key",
-                        0x78: "Response pending"
-                    }
-                    result += f"   Failed Service: 0x{failed_service:02X}\n"
-                    result += f"   NRC: 0x{nrc:02X} - {nrc_codes.get(nrc, 'Unknown error')}\n"
+                    parts.append(f"   Failed Service: 0x{failed_service:02X}\n")
+                    parts.append(f"   NRC: 0x{nrc:02X} - {_NRC_CODES.get(nrc, 'Unknown error')}\n")
 
             else:
-                result += f"   Type: Unknown (0x{first_byte:02X})\n"
+                parts.append(f"   Type: Unknown (0x{first_byte:02X})\n")
 
-            result += "\n"
+            parts.append("\n")
 
         # Show complete decoded message
-        if total_ascii:
-            result += "-" * 60 + "\n"
-            result += "📊 COMPLETE DECODED MESSAGE:\n\n"
-
-            # Clean up the ASCII (remove null bytes and non-printable)
-            clean_ascii = ""
-            hex_representation = ""
-
-            for i, char in enumerate(total_ascii):
-                if char == "·":
-                    continue
-                elif len(char) > 1:  # \xXX format
-                    hex_representation += char + " "
-                elif 32 <= ord(char) <= 126:  # Printable ASCII
-                    clean_ascii += char
-                    hex_representation += f"{ord(char):02X} "
-                else:
-                    hex_representation += f"\\x{ord(char):02X} "
-
-            if clean_ascii:
-                result += f"   ASCII: {clean_ascii}\n"
-
-            if hex_representation.strip():
-                result += f"   Hex: {hex_representation.strip()}\n"
+        if total_data:
+            parts.append("-" * 60 + "\n")
+            parts.append("📊 COMPLETE DECODED MESSAGE:\n\n")
+            parts.append(f"   ASCII: {_escaped_ascii(total_data)}\n")
+            parts.append(f"   Hex: {total_data.hex(' ').upper()}\n")
 
         # Show UDS quick reference
-        result += "\n" + "=" * 60 + "\n"
-        result += "📚 UDS QUICK REFERENCE:\n\n"
-        result += "Service 0x22 - Read Data By Identifier\n"
-        result += "  • Positive Response: 0x62\n"
-        result += "  • First Frame: 0x10 XX 62 F1 90 ...\n"
-        result += "  • Continuation: 0x2N (N = frame number)\n\n"
-        result += "Common DIDs:\n"
-        result += "  • 0xF190 - VIN\n"
-        result += "  • 0xF180 - Boot Software ID\n"
-        result += "  • 0xF181 - Application Software ID\n"
-        result += "  • 0xF18C - ECU Serial Number\n"
-        result += "=" * 60
-
-        # Display results
-        self.results_text.delete("1.0", "end")
-        self.results_text.insert("1.0", result)
+        parts.append("\n" + "=" * 60 + "\n")
+        parts.append("📚 UDS QUICK REFERENCE:\n\n")
+        parts.append("Service 0x22 - Read Data By Identifier\n")
+        parts.append("  • Positive Response: 0x62\n")
+        parts.append("  • First Frame: 0x10 XX 62 F1 90 ...\n")
+        parts.append("  • Continuation: 0x2N (N = frame number)\n\n")
+        parts.append("Common DIDs:\n")
+        parts.append("  • 0xF190 - VIN\n")
+        parts.append("  • 0xF180 - Boot Software ID\n")
+        parts.append("  • 0xF181 - Application Software ID\n")
+        parts.append("  • 0xF18C - ECU Serial Number\n")
+        parts.append("=" * 60)
+
+        return "".join(parts)
 
     def run_doip(self):
         """Run DoIP with optional interface"""
@@ -3029,37 +2930,16 @@ vcan0  7E8   [8]  22 38 38 38 38 38 38 38"""
         super()._apply_scaling(scale_factor)
         
         # Scale tabview fonts
-        if hasattr(self.tabs, '_segmented_button'):
-            self.tabs._segmented_button.configure(font=FontConfig.get_tab_font(scale_factor))
+        tab_font = FontConfig.get_tab_font(scale_factor)
+        if hasattr(self.tabs, '_segmented_button') and self._scaling_changed("tab_font", tab_font):
+            self.tabs._segmented_button.configure(font=tab_font)
 
 
 class SendFrame(ScalableFrame):
     def __init__(self, parent, app):
         super().__init__(parent, app)
 
-        self.head_frame = ctk.CTkFrame(self, fg_color="transparent")
-        self.head_frame.pack(fill="x")
-
-        self.title_label = ctk.CTkLabel(self.head_frame, text="Send & Replay", font=FontConfig.get_title_font(1.0))
-        self.title_label.pack(side="left")
-        self.register_widget(self.title_label, "title")
-
-        # Buttons
-        self.help_btn = ctk.CTkButton(self.head_frame, text="❓", fg_color="#f39c12", text_color="white",
-                      command=lambda: app.show_module_help("send"))
-        self.help_btn.pack(side="right", padx=5)
-        self.register_widget(self.help_btn, "button_small")
-
-        self.report_btn = ctk.CTkButton(self.head_frame, text="📥 Report (PDF)",
-                      command=lambda: app.save_module_report("SendReplay"))
-        self.report_btn.pack(side="right", padx=5)
-        self.register_widget(self.report_btn, "button_small")
-
-        # NEW: View Failures button
-        self.view_failures_btn = ctk.CTkButton(self.head_frame, text="📊 View Failures", 
-                      fg_color="#e74c3c", command=lambda: app.show_failure_cases())
-        self.view_failures_btn.pack(side="right", padx=5)
-        self.register_widget(self.view_failures_btn, "button_small")
+        self._build_header("Send & Replay", "send", "SendReplay")
 
         # Main container
         self.main_container = ctk.CTkFrame(self)
@@ -3073,7 +2953,7 @@ class SendFrame(ScalableFrame):
         self.send_type = ctk.CTkOptionMenu(self.main_container,
                                          values=["message", "file"],
                                          command=self.on_send_type_change,
-                                         fg_color="#1f538d", button_color="#1f538d", button_hover_color="#14375e")
+                                         **_DROPDOWN_STYLE)
         self.send_type.pack(pady=5, fill="x", padx=20)
         self.send_type.set("message")
         self.register_widget(self.send_type, "dropdown")
@@ -3090,7 +2970,7 @@ class SendFrame(ScalableFrame):
         self.msg_select = ctk.CTkOptionMenu(self.message_frame,
                                           values=["No DBC Loaded"],
                                           command=self.on_msg_select,
-                                          fg_color="#1f538d", button_color="#1f538d", button_hover_color="#14375e")
+                                          **_DROPDOWN_STYLE)
         self.msg_select.pack(pady=5, fill="x")
         self.register_widget(self.msg_select, "dropdown")
 
@@ -3278,6 +3158,11 @@ class SendFrame(ScalableFrame):
 
 
 class MonitorFrame(ScalableFrame):
+    # Messages kept for scrolling back and CSV export; older ones are dropped
+    MAX_ROWS = 1000
+    # Rows of label widgets on screen; scrolling only changes their text
+    VISIBLE_ROWS = 20
+
     def __init__(self, parent, app):
         super().__init__(parent, app)
         self.is_monitoring = False
@@ -3307,67 +3192,180 @@ class MonitorFrame(ScalableFrame):
         self.cols = ["Time", "ID", "Name", "Signals", "Raw"]
         self.header = ctk.CTkFrame(self, fg_color="#111")
         self.header.pack(fill="x")
+        header_font = FontConfig.get_label_font(1.0, bold=True)
         for i, c in enumerate(self.cols):
-            lbl = ctk.CTkLabel(self.header, text=c, font=FontConfig.get_label_font(1.0, bold=True))
+            lbl = ctk.CTkLabel(self.header, text=c, font=header_font)
             lbl.grid(row=0, column=i, sticky="ew", padx=2)
             self.register_widget(lbl, "label")
             self.header.grid_columnconfigure(i, weight=1)
 
-        self.scroll = ctk.CTkScrollableFrame(self, fg_color="#1a1a1a")
-        self.scroll.pack(fill="both", expand=True)
+        # The table is a fixed grid of VISIBLE_ROWS label rows showing a
+        # window onto the message history, moved by the scrollbar and wheel
+        self.table = ctk.CTkFrame(self, fg_color="#1a1a1a")
+        self.table.pack(fill="both", expand=True)
+        self.table.grid_columnconfigure(tuple(range(len(self.cols))), weight=1)
+
+        self.vbar = ctk.CTkScrollbar(self.table, command=self._on_scrollbar)
+        self.vbar.grid(row=0, column=len(self.cols), rowspan=self.VISIBLE_ROWS, sticky="ns")
+
+        font = FontConfig.get_mono_font(1.0)
+        self._row_cells = []
+        for r in range(self.VISIBLE_ROWS):
+            cells = []
+            for i in range(len(self.cols)):
+                lbl = ctk.CTkLabel(self.table, text="", font=font, anchor="w", fg_color=("gray20", "gray15"))
+                lbl.grid(row=r, column=i, sticky="ew", padx=1, pady=1)
+                for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                    lbl.bind(seq, self._on_mousewheel)
+                self.register_widget(lbl, "label")
+                cells.append(lbl)
+            self._row_cells.append(cells)
+        # Text each pooled label currently shows, to skip no-op configures
+        self._shown = [[""] * len(self.cols) for _ in range(self.VISIBLE_ROWS)]
+
+        # Message history kept column by column, oldest first
+        self._cols = [[] for _ in self.cols]
+        self._top = 0          # History index shown in the first row
+        self._follow = True    # Keep showing the newest rows while at the bottom
+
+        # Frames from the simulation thread, added to the table by _drain
+        self._rowq = queue.SimpleQueue()
+        self._draining = False
+        # Set to stop the running simulation thread; each run gets its own
+        self._stop = threading.Event()
 
     def save_monitor(self):
         fn = filedialog.asksaveasfilename(defaultextension=".csv")
         if fn:
-            with open(fn, "w") as f:
-                f.write("Time,ID,Name,Signals,Raw\n")
-                for row in self.scroll.winfo_children():
-                    cols = [w.cget("text") for w in row.winfo_children() if isinstance(w, ctk.CTkLabel)]
-                    f.write(",".join(cols) + "\n")
+            with open(fn, "w", newline="", buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(self.cols)
+                writer.writerows(zip(*self._cols))
 
     def clear(self):
-        for w in self.scroll.winfo_children(): 
-            w.destroy()
+        for col in self._cols:
+            col.clear()
+        self._top = 0
+        self._follow = True
+        self._render()
 
     def toggle_sim(self):
         if not self.is_monitoring:
             self.is_monitoring = True
-            threading.Thread(target=self._sim, daemon=True).start()
+            self._stop = threading.Event()
+            threading.Thread(target=self._sim, args=(self._stop,), daemon=True).start()
+            if not self._draining:
+                self._draining = True
+                self.after(50, self._drain)
         else: 
             self.is_monitoring = False
-
-    def _sim(self):
-        while self.is_monitoring:
+            self._stop.set()
+
+    def _sim(self, stop):
+        """Simulation thread: generate frames and queue them as ready-made table rows"""
+        choice, randbytes, randint, put = random.choice, random.randbytes, random.randint, self._rowq.put
+        strftime, localtime, now = time.strftime, time.localtime, time.time
+        # Frames arrive several per second; format each second only once
+        last_sec, stamp = None, ""
+        while not stop.is_set():
             if self.app.dbc_db and self.app.dbc_db.messages:
-                m = random.choice(self.app.dbc_db.messages)
-                b = bytes([random.getrandbits(8) for _ in range(m.length)])
-                self.after(0, lambda i=m.frame_id, d=b: self.add_row(i, d))
+                m = choice(self.app.dbc_db.messages)
+                aid, data = m.frame_id, randbytes(m.length)
             else:
-                b = bytes([random.getrandbits(8) for _ in range(8)])
-                self.after(0, lambda i=random.randint(0x100, 0x500), d=b: self.add_row(i, d))
-            time.sleep(0.2)
+                aid, data = randint(0x100, 0x500), randbytes(8)
 
-    def add_row(self, aid, data):
-        if len(self.scroll.winfo_children()) > 60: 
-            self.scroll.winfo_children()[0].destroy()
-        vals = [time.strftime("%H:%M:%S"), hex(aid), "Unknown", "---", " ".join(f"{b:02X}" for b in data)]
+            sec = int(now())
+            if sec != last_sec:
+                last_sec, stamp = sec, strftime("%H:%M:%S", localtime(sec))
 
-        if self.app.dbc_db:
+            # DBC decoding happens here so the Tk thread only sets label text
+            name, signals = "Unknown", "---"
+            m = self.app.dbc_by_id.get(aid)
+            if m:
+                name = m.name
+                try:
+                    signals = str(m.decode(data))
+                except: 
+                    pass
+
+            put((stamp, f"{aid:#x}", name, signals, data.hex(" ").upper()))
+            # Returns as soon as the simulation is stopped
+            stop.wait(0.2)
+
+    def _drain(self, max_rows=100):
+        """Add queued frames to the table, one batch per tick"""
+        batch = []
+        for _ in range(max_rows):
             try:
-                m = self.app.dbc_db.get_message_by_frame_id(aid)
-                if m:
-                    vals[2] = m.name
-                    vals[3] = str(m.decode(data))
-            except: 
-                pass
-
-        row = ctk.CTkFrame(self.scroll, fg_color=("gray20", "gray15"))
-        row.pack(fill="x", pady=1)
-        for i, v in enumerate(vals):
-            lbl = ctk.CTkLabel(row, text=v, font=FontConfig.get_mono_font(1.0), anchor="w")
-            lbl.grid(row=0, column=i, sticky="ew", padx=2)
-            self.register_widget(lbl, "label")
-            row.grid_columnconfigure(i, weight=1)
+                batch.append(self._rowq.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self.add_rows(batch)
+
+        # Keep going while simulating or until the backlog is gone
+        if self.is_monitoring or not self._rowq.empty():
+            self.after(50, self._drain)
+        else:
+            self._draining = False
+
+    def add_rows(self, batch):
+        """Add formatted rows (one string per column), trimming the history to MAX_ROWS in one go"""
+        batch = batch[-self.MAX_ROWS:]
+        overflow = len(self._cols[0]) + len(batch) - self.MAX_ROWS
+        if overflow > 0:
+            for col in self._cols:
+                del col[:overflow]
+            # Keep the same messages in view when scrolled back
+            self._top = max(0, self._top - overflow)
+
+        for col, vals in zip(self._cols, zip(*batch)):
+            col.extend(vals)
+
+        if self._follow:
+            self._top = max(0, len(self._cols[0]) - self.VISIBLE_ROWS)
+        self._render()
+
+    def _render(self):
+        """Fill the label rows from the history, starting at self._top"""
+        total = len(self._cols[0])
+        for r, (cells, shown) in enumerate(zip(self._row_cells, self._shown)):
+            idx = self._top + r
+            for c, (lbl, col) in enumerate(zip(cells, self._cols)):
+                text = col[idx] if idx < total else ""
+                if text != shown[c]:
+                    shown[c] = text
+                    lbl.configure(text=text)
+
+        if total > self.VISIBLE_ROWS:
+            self.vbar.set(self._top / total, (self._top + self.VISIBLE_ROWS) / total)
+        else:
+            self.vbar.set(0, 1)
+
+    def _scroll_to(self, top):
+        """Move the visible window so that history row `top` is first"""
+        max_top = max(0, len(self._cols[0]) - self.VISIBLE_ROWS)
+        self._top = max(0, min(int(top), max_top))
+        self._follow = self._top == max_top
+        self._render()
+
+    def _on_scrollbar(self, *args):
+        """Scrollbar command: ('moveto', fraction) or ('scroll', n, 'units'/'pages')"""
+        if args[0] == "moveto":
+            self._scroll_to(float(args[1]) * len(self._cols[0]))
+        elif args[0] == "scroll":
+            step = self.VISIBLE_ROWS if args[2] == "pages" else 1
+            self._scroll_to(self._top + int(args[1]) * step)
+
+    def _on_mousewheel(self, event):
+        """Scroll the table with the mouse wheel, as CTkScrollbar does"""
+        if sys.platform.startswith("win"):
+            delta = -int(event.delta / 40)
+        elif sys.platform == "darwin":
+            delta = -event.delta
+        else:
+            delta = -1 if event.num == 4 else 1
+        self._scroll_to(self._top + delta)
 
     def _apply_scaling(self, scale_factor):
         """Apply responsive scaling to all elements"""
@@ -3375,4 +3373,5 @@ class MonitorFrame(ScalableFrame):
         
         # Update header height
         header_height = FontConfig.get_height("button_small", scale_factor)
-        self.header.configure(height=header_height)
\ No newline at end of file
+        if self._scaling_changed("header_height", header_height):
+            self.header.configure(height=header_height)
\ No newline at end of file
@@ -3,6 +3,7 @@ from tkinter import filedialog, messagebox
 import subprocess
 import threading
 import os
+import queue
 import signal
 import sys
 import time
@@ -46,12 +47,21 @@ class FucyfuzzApp(ctk.CTk):
         self.session_history = []
         self.full_log_buffer = []
         self.pending_console_messages = []  # Store messages until console is ready
+        self._console_q = queue.SimpleQueue()  # Console text waiting for _flush_console
+        self._console_flush_scheduled = False
         self.failure_cases = {}  # Store failure cases by module: {module_name: [failed_entries]}
         self.raw_logs = [] 
 
         # GLOBAL DBC STORE
         self.dbc_db = None
         self.dbc_messages = {}
+        self.dbc_by_id = {}  # {frame_id: message}, for decoding received frames
+        self.dbc_hex_ids = {}  # {name: "0x..."}, for the message dropdowns
+
+        # SUBPROCESS SETUP, shared by every fucyfuzz command the GUI starts
+        self._cached_cmd_prefix = [sys.executable, "-m", "fucyfuzz.fucyfuzz"]
+        self._cached_env = None
+        self._cached_env_wd = None
 
         self.load_failure_cases_from_file()
         # Initialize Module Runner
@@ -95,34 +105,36 @@ class FucyfuzzApp(ctk.CTk):
         # ===========================
         # 1) TABVIEW WITH SCALING
         # ===========================
-        self.tabs = ctk.CTkTabview(self)
+        self.tabs = ctk.CTkTabview(self, command=self._on_tab_change)
         self.tabs.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
 
-        tab_names = [
-            "Configuration", "Recon", "Dashboard","Demo", "Fuzzer", "Length Attack",
-            "DCM","UDS", "Advanced", "Send", "Monitor"
-        ]
-        for name in tab_names:
+        # Tab name -> (key in self.frames, frame class)
+        self._tab_frames = {
+            "Configuration": ("config", ConfigFrame),
+            "Recon": ("recon", ReconFrame),
+            "Dashboard": ("dashboard", DashboardFrame),
+            "Demo": ("demo", DemoFrame),
+            "Fuzzer": ("fuzzer", FuzzerFrame),
+            "Length Attack": ("lenattack", LengthAttackFrame),
+            "DCM": ("dcm", DCMFrame),
+            "UDS": ("uds", UDSFrame),
+            "Advanced": ("advanced", AdvancedFrame),
+            "Send": ("send", SendFrame),
+            "Monitor": ("monitor", MonitorFrame),
+        }
+        for name in self._tab_frames:
             self.tabs.add(name)
 
         # ===========================
         # 2) TAB FRAMES
         # ===========================
+        # "Use -i vcan0 interface" preference shared by Recon, Fuzzer and Length Attack
+        self.use_interface_var = ctk.BooleanVar(value=True)
+
+        # Frames are built the first time their tab is shown; only the
+        # opening tab is built at startup
         self.frames = {}
-        self.frames["config"] = ConfigFrame(self.tabs.tab("Configuration"), self)
-        self.frames["recon"] = ReconFrame(self.tabs.tab("Recon"), self)
-        self.frames["dashboard"] = DashboardFrame(self.tabs.tab("Dashboard"), self)
-        self.frames["demo"] = DemoFrame(self.tabs.tab("Demo"), self)
-        self.frames["fuzzer"] = FuzzerFrame(self.tabs.tab("Fuzzer"), self)
-        self.frames["lenattack"] = LengthAttackFrame(self.tabs.tab("Length Attack"), self)
-        self.frames["dcm"] = DCMFrame(self.tabs.tab("DCM"), self)
-        self.frames["uds"] = UDSFrame(self.tabs.tab("UDS"), self)
-        self.frames["advanced"] = AdvancedFrame(self.tabs.tab("Advanced"), self)
-        self.frames["send"] = SendFrame(self.tabs.tab("Send"), self)
-        self.frames["monitor"] = MonitorFrame(self.tabs.tab("Monitor"), self)
-
-        for frm in self.frames.values():
-            frm.pack(fill="both", expand=True, padx=15, pady=15)
+        self._build_tab_frame(self.tabs.get())
 
         # ===========================
         # 3) CONSOLE
@@ -189,7 +201,7 @@ class FucyfuzzApp(ctk.CTk):
 
         # Bind main window resize to update all frames
         self.bind("<Configure>", self._on_main_resize)
-        self._last_resize_time = 0
+        self._resize_after_id = None
     
     def _flush_pending_console_messages(self):
         """Write any pending console messages that were stored before console was ready"""
@@ -251,27 +263,30 @@ class FucyfuzzApp(ctk.CTk):
         return frame
 
     def _on_main_resize(self, event=None):
-        # Throttle resize events to prevent excessive updates
-        current_time = time.time()
-        if current_time - self._last_resize_time > 0.1:  # 100ms throttle
-            self._last_resize_time = current_time
+        # Coalesce resize bursts: rescale once, 100ms after the first event,
+        # by which time the window has its latest size
+        if self._resize_after_id is None:
+            self._resize_after_id = self.after(100, self._apply_main_resize)
 
-            # Check if window still exists
-            if not self.winfo_exists():
-                return
+    def _apply_main_resize(self):
+        self._resize_after_id = None
 
-            try:
-                # 1. Update Global Tab Scaling
-                self._update_app_scaling()
+        # Check if window still exists
+        if not self.winfo_exists():
+            return
 
-                # 2. Update all frames
-                for frame in self.frames.values():
-                    if hasattr(frame, 'update_scaling') and frame.winfo_exists():
-                        frame.update_scaling()
-            except Exception as e:
-                # Ignore resize errors during window destruction
-                if "invalid command name" not in str(e) and "has been destroyed" not in str(e):
-                    print(f"Resize error: {e}")
+        try:
+            # 1. Update Global Tab Scaling
+            self._update_app_scaling()
+
+            # 2. Update all frames
+            for frame in self.frames.values():
+                if hasattr(frame, 'update_scaling') and frame.winfo_exists():
+                    frame.update_scaling()
+        except Exception as e:
+            # Ignore resize errors during window destruction
+            if "invalid command name" not in str(e) and "has been destroyed" not in str(e):
+                print(f"Resize error: {e}")
 
 
 
@@ -289,8 +304,8 @@ class FucyfuzzApp(ctk.CTk):
             if current_width < 100 or current_height < 100:
                 return
 
-            # Calculate scale factor
-            scale_factor = min(current_width / self.base_width, current_height / self.base_height)
+            # Calculate scale factor, rounded so FontConfig lookups are cache hits
+            scale_factor = round(min(current_width / self.base_width, current_height / self.base_height), 2)
             
             # Calculate Font Sizes using FontConfig
             tab_font = FontConfig.get_tab_font(scale_factor)
@@ -373,6 +388,10 @@ class FucyfuzzApp(ctk.CTk):
             if self.current_process:
                 self.stop_process()
 
+            # Demo fuzzers run detached from current_process; don't leave them on the bus
+            if "demo" in self.frames:
+                self.frames["demo"].stop_all(reset=False)
+
             # Unbind events to prevent callbacks during destruction
             self.unbind("<Configure>")
 
@@ -400,6 +419,8 @@ class FucyfuzzApp(ctk.CTk):
         try:
             self.dbc_db = cantools.database.load_file(fp)
             self.dbc_messages = {msg.name: msg.frame_id for msg in self.dbc_db.messages}
+            self.dbc_by_id = {msg.frame_id: msg for msg in self.dbc_db.messages}
+            self.dbc_hex_ids = {msg.name: hex(msg.frame_id) for msg in self.dbc_db.messages}
 
             msg_count = len(self.dbc_messages)
             self._console_write(f"[INFO] Loaded DBC: {os.path.basename(fp)} ({msg_count} messages)\n")
@@ -560,18 +581,37 @@ class FucyfuzzApp(ctk.CTk):
             messagebox.showinfo("Export Complete", f"MDF4 exported: {result}")
         self.btn_reports_dropdown.set("📊 Export Reports")
 
+    def _on_tab_change(self):
+        self._build_tab_frame(self.tabs.get())
+
+    def _build_tab_frame(self, tab_name):
+        """Create the frame for a tab on first visit"""
+        key, frame_cls = self._tab_frames[tab_name]
+        if key in self.frames:
+            return
+
+        frm = frame_cls(self.tabs.tab(tab_name), self)
+        frm.pack(fill="both", expand=True, padx=15, pady=15)
+        self.frames[key] = frm
+
+        # Catch up with a DBC and window size that arrived before the frame existed
+        if self.dbc_messages and hasattr(frm, "update_msg_list"):
+            frm.update_msg_list(sorted(self.dbc_messages))
+        if hasattr(frm, "update_scaling"):
+            self.after(100, frm.update_scaling)
+
     def refresh_tab_dropdowns(self):
         msg_names = sorted(list(self.dbc_messages.keys()))
         if not msg_names: return
 
         for tab_name in ["fuzzer", "lenattack", "send", "uds","dcm"]:
-            if hasattr(self.frames[tab_name], "update_msg_list"):
+            # Frames not built yet pick the list up in _build_tab_frame
+            if hasattr(self.frames.get(tab_name), "update_msg_list"):
                 self.frames[tab_name].update_msg_list(msg_names)
 
     def get_id_by_name(self, name):
-        if name in self.dbc_messages:
-            return hex(self.dbc_messages[name])
-        return ""
+        # Formatted once per DBC load; a reload replaces the whole map
+        return self.dbc_hex_ids.get(name, "")
 
     # =======================================
     # HELP MODAL LOGIC
@@ -587,16 +627,13 @@ class FucyfuzzApp(ctk.CTk):
         for mod in module_names:
             full_output += f"=== HELP: {mod.upper()} ===\n"
 
-            cmd = [sys.executable, "-m", "fucyfuzz.fucyfuzz", mod, "--help"]
+            cmd = self._cached_cmd_prefix + [mod, "--help"]
             full_output += f"Command: {' '.join(cmd)}\n\n"
 
             try:
-                env = os.environ.copy()
-                env["PYTHONPATH"] = self.working_dir + os.pathsep + env.get("PYTHONPATH", "")
-
                 output = subprocess.check_output(
                     cmd,
-                    env=env,
+                    env=self._subprocess_env(),
                     stderr=subprocess.STDOUT,
                     cwd=self.working_dir,
                     text=True,
@@ -729,11 +766,39 @@ class FucyfuzzApp(ctk.CTk):
 
 
 
+    def _flush_console(self):
+        """Insert all queued console text in one call"""
+        self._console_flush_scheduled = False
+        # Worker threads keep putting while this drains; anything put after
+        # the flag was cleared schedules the next flush
+        buf = []
+        while True:
+            try:
+                buf.append(self._console_q.get_nowait())
+            except queue.Empty:
+                break
+        if buf and self.console.winfo_exists():
+            self.console.insert("end", "".join(buf))
+            self.console.see("end")
+
+    def _subprocess_env(self):
+        """Environment for fucyfuzz subprocesses, rebuilt only when working_dir changes"""
+        if self._cached_env_wd != self.working_dir:
+            env = os.environ.copy()
+            env["PYTHONPATH"] = self.working_dir + os.pathsep + env.get("PYTHONPATH", "")
+            self._cached_env = env
+            self._cached_env_wd = self.working_dir
+        return self._cached_env
+
     def _console_write(self, text):
         """Write to console with thread safety"""
         self.full_log_buffer.append(text)
         if hasattr(self, 'console') and self.console.winfo_exists():
-            self.console.after(0, lambda: (self.console.insert("end", text), self.console.see("end")))
+            # Queue the text; one insert every 40ms writes whatever piled up
+            self._console_q.put(text)
+            if not self._console_flush_scheduled:
+                self._console_flush_scheduled = True
+                self.console.after(40, self._flush_console)
         else:
             if not hasattr(self, 'pending_console_messages'):
                 self.pending_console_messages = []
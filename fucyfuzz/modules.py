@@ -2,7 +2,6 @@ import subprocess
 import threading
 import os
 import signal
-import sys
 import time
 from datetime import datetime
 import re
@@ -24,10 +23,9 @@ class ModuleRunner:
 
         working_dir = self.app.working_dir
 
-        cmd = [sys.executable, "-m", "fucyfuzz.fucyfuzz"] + [str(a) for a in args_list]
+        cmd = self.app._cached_cmd_prefix + [str(a) for a in args_list]
 
-        env = os.environ.copy()
-        env["PYTHONPATH"] = working_dir + os.pathsep + env.get("PYTHONPATH", "")
+        env = self.app._subprocess_env()
 
         self.app._console_write(f"\n>>> [{module_name}] START: {' '.join(cmd)}\n")
         self.app._console_write(f">>> CWD: {working_dir}\n")
@@ -0,0 +1,77 @@
+import os
+import sys
+import unittest
+
+# The GUI modules import their siblings by bare name (e.g. "from fonts import FontConfig")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import frame_classes
+except ImportError as e:  # customtkinter / tkinter not available
+    raise unittest.SkipTest(f"GUI dependencies missing: {e}")
+
+
+class DumpDidsDecoderTestCase(unittest.TestCase):
+    # Output of "uds dump_dids --min_did 0xf190 --max_did 0xf190" as read back
+    # by _execute_dump_dids: stderr progress ("0xf190\r") is merged into
+    # stdout and the newline decoder turns the carriage return into a line break
+    DUMP_DIDS_OUTPUT = [
+        "Dumping DIDs in range 0xf190-0xf190\n",
+        "\n",
+        "Identified DIDs:\n",
+        "DID    Value (hex)\n",
+        "0xf190\n",
+        "0xf190 4655435954454348\n",
+        "\x1b[K\n",
+        "Done!\n",
+    ]
+
+    def setUp(self):
+        # The decoders only use their own helpers, so no Tk root is needed
+        self.frame = frame_classes.AdvancedFrame.__new__(frame_classes.AdvancedFrame)
+
+    def test_decode_unbroken_hex_run(self):
+        report = self.frame._decode_uds_response(self.DUMP_DIDS_OUTPUT)
+        self.assertIn("Decoded VIN: FUCYTECH\n", report)
+        self.assertIn("Raw hex: 46 55 43 59 54 45 43 48\n", report)
+
+    def test_header_and_progress_lines_are_not_dids(self):
+        report = self.frame._decode_uds_response(self.DUMP_DIDS_OUTPUT)
+        self.assertEqual(report.count("Found DID: 0xF190"), 1)
+
+    def test_decode_several_dids(self):
+        output = [
+            "Dumping DIDs in range 0xf180-0xf190\n",
+            "0xf180 0102\n",
+            "0xf18c 534e3132\n",
+            "Done!\n",
+        ]
+        report = self.frame._decode_uds_response(output)
+        self.assertIn("Found DID: 0xF180\n", report)
+        self.assertIn("Hex: 01 02\n", report)
+        self.assertIn("Found DID: 0xF18C\n", report)
+        self.assertIn("ASCII: SN12\n", report)
+        self.assertNotIn("0xF190", report.split("UDS RESPONSE FORMAT REFERENCE")[0])
+
+
+class UdsAnalyzerTestCase(unittest.TestCase):
+    def test_complete_message_hex_shows_message_bytes(self):
+        # Byte 0x01 is shown as "\x01" in the ASCII line, but the hex line
+        # lists the byte itself, not the escape text ("5C 78 30 31")
+        report = frame_classes.AdvancedFrame._format_uds_analysis(
+            "vcan0  7E8   [8]  10 08 62 F1 90 46 01 55\n"
+            "vcan0  7E8   [8]  21 43 59 00 00 00 00 00")
+        complete = report.split("COMPLETE DECODED MESSAGE:")[1]
+        self.assertIn("   ASCII: F\\x01UCY\n", complete)
+        self.assertIn("   Hex: 46 01 55 43 59\n", complete)
+        self.assertNotIn("5C 78", complete)
+
+    def test_vin_example(self):
+        report = frame_classes.AdvancedFrame._format_uds_analysis(frame_classes._UDS_EXAMPLES["vin"])
+        complete = report.split("COMPLETE DECODED MESSAGE:")[1]
+        self.assertIn("   ASCII: FUCYTECH-VIN-0001\n", complete)
+        self.assertIn("   Hex: 46 55 43 59 54 45 43 48 2D 56 49 4E 2D 30 30 30 31\n", complete)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,8 @@
 """
 Common UI scaling utilities for all frames
 """
+import functools
+
 import customtkinter as ctk
 from fonts import FontConfig
 
@@ -15,34 +17,46 @@ class UIScaling:
             return
         
         try:
-            if isinstance(widget, ctk.CTkLabel):
-                UIScaling._scale_label(widget, widget_type, scale_factor)
-            elif isinstance(widget, ctk.CTkButton):
-                UIScaling._scale_button(widget, widget_type, scale_factor)
-            elif isinstance(widget, ctk.CTkEntry):
-                UIScaling._scale_entry(widget, scale_factor)
-            elif isinstance(widget, ctk.CTkOptionMenu):
-                UIScaling._scale_dropdown(widget, scale_factor)
-            elif isinstance(widget, ctk.CTkCheckBox):
-                UIScaling._scale_checkbox(widget, scale_factor)
-            elif isinstance(widget, ctk.CTkTextbox):
-                UIScaling._scale_textbox(widget, scale_factor)
+            options = UIScaling.scale_options(type(widget), widget_type, scale_factor)
+            # Registered widgets are reached twice per pass and clamped sizes
+            # repeat across scales, so skip configure when nothing changes
+            if options and getattr(widget, "_scaled_options", None) != options:
+                widget.configure(**options)
+                widget._scaled_options = options
         except Exception as e:
             print(f"Warning: Could not scale widget {widget_type}: {e}")
     
     @staticmethod
-    def _scale_label(widget, widget_type, scale_factor):
-        """Scale label widget"""
+    @functools.lru_cache(maxsize=256)
+    def scale_options(widget_class, widget_type, scale_factor):
+        """configure() options for a widget class and type, built once per scale factor"""
+        if issubclass(widget_class, ctk.CTkLabel):
+            return UIScaling._label_options(widget_type, scale_factor)
+        elif issubclass(widget_class, ctk.CTkButton):
+            return UIScaling._button_options(widget_type, scale_factor)
+        elif issubclass(widget_class, ctk.CTkEntry):
+            return UIScaling._entry_options(scale_factor)
+        elif issubclass(widget_class, ctk.CTkOptionMenu):
+            return UIScaling._dropdown_options(scale_factor)
+        elif issubclass(widget_class, ctk.CTkCheckBox):
+            return UIScaling._checkbox_options(scale_factor)
+        elif issubclass(widget_class, ctk.CTkTextbox):
+            return UIScaling._textbox_options(scale_factor)
+        return {}
+    
+    @staticmethod
+    def _label_options(widget_type, scale_factor):
+        """Options for a label widget"""
         if "title" in widget_type.lower():
-            widget.configure(font=FontConfig.get_title_font(scale_factor))
+            return {"font": FontConfig.get_title_font(scale_factor)}
         elif "header" in widget_type.lower():
-            widget.configure(font=FontConfig.get_section_font(scale_factor))
+            return {"font": FontConfig.get_section_font(scale_factor)}
         else:
-            widget.configure(font=FontConfig.get_label_font(scale_factor))
+            return {"font": FontConfig.get_label_font(scale_factor)}
     
     @staticmethod
-    def _scale_button(widget, widget_type, scale_factor):
-        """Scale button widget"""
+    def _button_options(widget_type, scale_factor):
+        """Options for a button widget"""
         # Determine button size
         if "large" in widget_type.lower() or "main" in widget_type.lower():
             height = FontConfig.get_height("button_large", scale_factor)
@@ -57,45 +71,44 @@ class UIScaling:
             width = FontConfig.get_width("button", scale_factor)
             font = FontConfig.get_button_font(scale_factor, bold="start" in widget_type.lower() or "execute" in widget_type.lower())
         
-        # Apply scaling
-        widget.configure(
-            height=height,
-            width=width if width > 0 else None,
-            font=font,
-            corner_radius=FontConfig.get_corner_radius(scale_factor)
-        )
+        return {
+            "height": height,
+            "width": width if width > 0 else None,
+            "font": font,
+            "corner_radius": FontConfig.get_corner_radius(scale_factor)
+        }
     
     @staticmethod
-    def _scale_entry(widget, scale_factor):
-        """Scale entry widget"""
+    def _entry_options(scale_factor):
+        """Options for an entry widget"""
         height = FontConfig.get_height("entry", scale_factor)
-        widget.configure(
-            height=height,
-            font=FontConfig.get_entry_font(scale_factor),
-            corner_radius=FontConfig.get_corner_radius(scale_factor)
-        )
+        return {
+            "height": height,
+            "font": FontConfig.get_entry_font(scale_factor),
+            "corner_radius": FontConfig.get_corner_radius(scale_factor)
+        }
     
     @staticmethod
-    def _scale_dropdown(widget, scale_factor):
-        """Scale dropdown widget"""
+    def _dropdown_options(scale_factor):
+        """Options for a dropdown widget"""
         height = FontConfig.get_height("dropdown", scale_factor)
         font = FontConfig.get_entry_font(scale_factor)
-        widget.configure(
-            height=height,
-            font=font,
-            dropdown_font=font,
-            corner_radius=FontConfig.get_corner_radius(scale_factor)
-        )
+        return {
+            "height": height,
+            "font": font,
+            "dropdown_font": font,
+            "corner_radius": FontConfig.get_corner_radius(scale_factor)
+        }
     
     @staticmethod
-    def _scale_checkbox(widget, scale_factor):
-        """Scale checkbox widget"""
-        widget.configure(font=FontConfig.get_checkbox_font(scale_factor))
+    def _checkbox_options(scale_factor):
+        """Options for a checkbox widget"""
+        return {"font": FontConfig.get_checkbox_font(scale_factor)}
     
     @staticmethod
-    def _scale_textbox(widget, scale_factor):
-        """Scale textbox widget"""
-        widget.configure(font=FontConfig.get_mono_font(scale_factor))
+    def _textbox_options(scale_factor):
+        """Options for a textbox widget"""
+        return {"font": FontConfig.get_mono_font(scale_factor)}
     
     @staticmethod
     def scale_frame_children(parent_frame, scale_factor, exclude_types=None):
@@ -4,6 +4,7 @@
 import argparse
 import can
 import errno
+import json
 from .utils import can_actions
 import sys
 import traceback
@@ -95,11 +96,15 @@ def parse_arguments():
                                      epilog=available_modules())
     parser.add_argument("-i", dest="interface", default=None,
                         help="force interface, e.g. 'can1' or 'vcan0'")
-    parser.add_argument("module",
+    parser.add_argument("--server", action="store_true",
+                        help="read commands from stdin instead, one JSON list of module and arguments per line")
+    parser.add_argument("module", nargs="?",
                         help="Name of the module to run")
     parser.add_argument("module_args", metavar="...", nargs=argparse.REMAINDER,
                         help="Arguments to module")
     args = parser.parse_args()
+    if args.module is None and not args.server:
+        parser.error("the following arguments are required: module")
     return args
 
 
@@ -121,6 +126,32 @@ def load_module(module_name):
         return None
 
 
+def serve():
+    """
+    Run module commands read from stdin until it is closed.
+
+    Each line is a JSON list holding a module name and its arguments,
+    e.g. ["send", "message", "0x244#00"]. Lets a frontend run many short
+    commands without starting a new interpreter for each one.
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            command = json.loads(line)
+            cc_mod = load_module(command[0])
+            if cc_mod is not None:
+                cc_mod.module_main(command[1:])
+        except SystemExit:
+            # Argument errors and module exits end the command, not the server
+            pass
+        except Exception:
+            traceback.print_exc()
+        finally:
+            sys.stdout.flush()
+
+
 def main():
     """Main execution handler"""
     # Parse and validate arguments
@@ -130,6 +161,9 @@ def main():
     # Save interface to can_actions, for use in modules
     if args.interface:
         can_actions.DEFAULT_INTERFACE = args.interface
+    if args.server:
+        serve()
+        return
     try:
         # Load module
         cc_mod = load_module(args.module)